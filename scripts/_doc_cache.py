@@ -0,0 +1,64 @@
+"""Shared document loading for the assistant scripts with an in-process cache."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from robot_assistant.runtime.ai.retrieval import Document
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def _load_one(path_str: str, mtime_ns: int, size: int) -> Document:
+    """Read one document; the stat fields only participate in the cache key."""
+    path = Path(path_str)
+    return Document(
+        doc_id=path.name,
+        content=path.read_text(),
+        metadata={"title": path.stem, "source_path": path_str},
+    )
+
+
+def _load_or_none(key: Tuple[str, int, int]) -> Optional[Document]:
+    try:
+        return _load_one(*key)
+    except (OSError, UnicodeDecodeError):
+        logger.warning("docs: failed to read %s", key[0])
+        return None
+
+
+def load_documents(paths: Iterable[str]) -> List[Document]:
+    """Load markdown documents, reusing cached entries for unchanged files.
+
+    Reads for uncached files are issued concurrently; the result keeps the
+    order of ``paths``.
+    """
+    keys: List[Tuple[str, int, int]] = []
+    for raw_path in paths:
+        path = Path(raw_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        keys.append((str(path), stat.st_mtime_ns, stat.st_size))
+    if not keys:
+        return []
+
+    hits_before = _load_one.cache_info().hits
+    with ThreadPoolExecutor(max_workers=min(8, len(keys))) as executor:
+        loaded = list(executor.map(_load_or_none, keys))
+    documents = [doc for doc in loaded if doc is not None]
+    hits = _load_one.cache_info().hits - hits_before
+    logger.info("docs: reused %d cached, read %d new", hits, len(documents) - hits)
+    return documents
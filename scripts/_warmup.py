@@ -0,0 +1,28 @@
+"""Shared untimed warmup for the assistant scripts."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from robot_assistant.runtime.system import RobotRuntime
+
+
+def warm_up(runtime: RobotRuntime, query: str = "warmup") -> None:
+    """Exercise retrieval and generation once so one-time setup stays out of measured latencies.
+
+    Calls the retriever and model gateway directly rather than ``handle()``,
+    so the warmup writes no turns to conversation memory and no entries to
+    the safety audit log.
+    """
+    assistant = runtime.assistant
+    try:
+        assistant.retriever.retrieve(query, top_k=assistant.config.retrieval.top_k)
+        assistant.model_gateway.generate(query, {"skill": "assistant", "query": query, "fast_path": True})
+    except Exception:  # pragma: no cover - warmup is best effort
+        pass
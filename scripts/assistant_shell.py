@@ -5,71 +5,258 @@ from __future__ import annotations
 
 import argparse
 import json
+import shutil
 import sys
 import textwrap
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from time import sleep
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional
+
+try:  # pragma: no cover - optional faster serializer
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = REPO_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from robot_assistant.runtime.ai.retrieval import Document
+from robot_assistant.config.defaults import RuntimeConfig
 from robot_assistant.runtime.system import RobotRuntime
 
+from _doc_cache import load_documents
 
-def load_documents(paths: Iterable[str]) -> List[Document]:
-    documents: List[Document] = []
-    for raw_path in paths:
-        path = Path(raw_path)
-        if not path.exists():
-            continue
-        documents.append(
-            Document(
-                doc_id=path.name,
-                content=path.read_text(),
-                metadata={"title": path.stem, "source_path": str(path)},
-            )
-        )
-    return documents
+# Pause between streamed chunks when --fake-typing is set.
+FAKE_TYPING_DELAY_S = 0.05
+
+_WRAPPER = textwrap.TextWrapper(width=88, break_long_words=False, replace_whitespace=False)
 
 
 def format_metrics(metadata: Dict[str, object]) -> str:
     lines: List[str] = []
-    latency = metadata.get("latency_ms", {})
+    latency = metadata.get("latency_ms")
     if latency:
         budget = ", ".join(f"{stage}={value:.1f}ms" for stage, value in latency.items())
         lines.append(f"latency: {budget}")
-    usage = metadata.get("usage", {})
+    usage = metadata.get("usage")
     if usage:
+        # ModelGateway always reports all three counters.
         lines.append(
-            "tokens: "
-            + ", ".join(
-                f"{key}={usage.get(key)}"
-                for key in ("prompt_tokens", "completion_tokens", "total_tokens")
-                if key in usage
-            )
+            f"tokens: prompt_tokens={usage.get('prompt_tokens')}, "
+            f"completion_tokens={usage.get('completion_tokens')}, "
+            f"total_tokens={usage.get('total_tokens')}"
         )
     lines.append(f"model: {metadata.get('model')}")
-    tools = metadata.get("tool_results", [])
+    tools = metadata.get("tool_results")
     if tools:
-        serialized = json.dumps(tools, indent=2) if len(tools) <= 3 else json.dumps(tools[:3], indent=2)
-        lines.append(f"tools: {serialized}")
+        if orjson is not None:
+            blob = orjson.dumps(tools[:3]).decode()
+        else:
+            blob = json.dumps(tools[:3], separators=(",", ":"))
+        lines.append(f"tools: {blob}")
     return " | ".join(lines)
 
 
-def stream_text(text: str, delay: float = 0.0) -> None:
-    """Print response text with optional streaming effect."""
-    if not text:
-        return
-    chunks = text.split()
-    for idx, chunk in enumerate(chunks):
-        end = "\n" if idx == len(chunks) - 1 else " "
-        print(chunk, end=end, flush=True)
+def stream_response(
+    stream: Generator[str, None, Dict[str, Any]], delay: float = 0.0
+) -> Dict[str, Any]:
+    """Print response deltas as the assistant produces them and return the final plan."""
+    if not sys.stdout.isatty():
+        delay = 0.0
+    plan: Dict[str, Any] = {}
+    while True:
+        try:
+            chunk = next(stream)
+        except StopIteration as stop:
+            plan = stop.value or {}
+            break
+        print(chunk, end="", flush=True)
         if delay:
             sleep(delay)
+    print()
+    return plan
+
+
+def write_response(text: str) -> None:
+    """Emit a response in one write, wrapping only for interactive terminals."""
+    if sys.stdout.isatty():
+        _WRAPPER.width = min(88, shutil.get_terminal_size().columns)
+        text = _WRAPPER.fill(text)
+    sys.stdout.write("Assistant> " + text + "\n")
+
+
+@dataclass
+class ShellContext:
+    """Mutable session state shared by the shell loop and command handlers."""
+
+    runtime: RobotRuntime
+    session_id: str
+    persona: str
+    fast_default: bool
+    history: Deque[Dict[str, str]]
+    preferences: Dict[str, str] = field(default_factory=dict)
+    fast_mode: bool = False
+    forced_model: Optional[str] = None
+    turn_count: int = 0
+    # Session-constant intent keys; per-turn intents are shallow copies of this.
+    intents_base: Dict[str, Any] = field(default_factory=dict)
+
+
+# Handlers return True to keep the shell running and False to exit.
+CommandHandler = Callable[[ShellContext, str], bool]
+
+_MODEL_ROUTES = {"default": None, "fast": "fast", "offline": "offline"}
+
+
+def _cmd_exit(ctx: ShellContext, argument: str) -> bool:
+    print("Goodbye.")
+    return False
+
+
+def _cmd_clear(ctx: ShellContext, argument: str) -> bool:
+    ctx.history.clear()
+    ctx.turn_count = 0
+    print("History cleared.")
+    return True
+
+
+def _cmd_persona(ctx: ShellContext, argument: str) -> bool:
+    ctx.persona = argument or ctx.persona
+    ctx.intents_base["instructions"] = ctx.persona
+    print(f"Persona set to: {ctx.persona}")
+    return True
+
+
+def _cmd_model(ctx: ShellContext, argument: str) -> bool:
+    key = argument.lower()
+    if key not in _MODEL_ROUTES:
+        print("Valid options: default, fast, offline")
+        return True
+    ctx.forced_model = _MODEL_ROUTES[key]
+    if ctx.forced_model == "fast":
+        ctx.fast_mode = True
+    elif ctx.forced_model == "offline":
+        ctx.fast_mode = False
+    else:
+        ctx.fast_mode = ctx.fast_default
+    print(f"Model routing updated: {key}")
+    return True
+
+
+def _cmd_history(ctx: ShellContext, argument: str) -> bool:
+    if not ctx.history:
+        print("(history empty)")
+    else:
+        for turn in ctx.history:
+            print(f"{turn['role']}: {turn['content']}")
+    return True
+
+
+def _cmd_tools(ctx: ShellContext, argument: str) -> bool:
+    for info in ctx.runtime.assistant.tools.list_tools():
+        status = "granted" if info["consent_granted"] else (
+            "required" if info["requires_consent"] else "not-needed"
+        )
+        print(
+            f"- {info['name']} [{info['category']}] "
+            f"({status}) :: {info['description']}"
+        )
+    return True
+
+
+def _cmd_consent(ctx: ShellContext, argument: str) -> bool:
+    if not argument:
+        print("Usage: /consent <tool_name>")
+    else:
+        ctx.runtime.assistant.tools.grant_consent(argument)
+        print(f"Consent granted for {argument}")
+    return True
+
+
+def _cmd_revoke(ctx: ShellContext, argument: str) -> bool:
+    if not argument:
+        print("Usage: /revoke <tool_name>")
+    else:
+        ctx.runtime.assistant.tools.revoke_consent(argument)
+        print(f"Consent revoked for {argument}")
+    return True
+
+
+def _cmd_prefs(ctx: ShellContext, argument: str) -> bool:
+    if not ctx.preferences:
+        print("(no stored preferences)")
+    else:
+        for key, value in ctx.preferences.items():
+            print(f"- {key}: {value}")
+    return True
+
+
+def _cmd_pref(ctx: ShellContext, argument: str) -> bool:
+    fields = argument.split(maxsplit=1)
+    if len(fields) != 2:
+        print("Usage: /pref <key> <value>")
+    else:
+        key, value = fields
+        ctx.runtime.memory.set_preference(ctx.session_id, key, value)
+        ctx.preferences[key] = value
+        print(f"Preference updated: {key}={value}")
+    return True
+
+
+def _cmd_priv(ctx: ShellContext, argument: str) -> bool:
+    safety = ctx.runtime.safety
+    if not argument:
+        print("Usage: /priv <informational|command>")
+        return True
+    try:
+        safety.set_privilege(argument)
+        print(f"Privilege set to {safety.privilege_level}")
+    except ValueError:
+        print("Invalid privilege level. Options: informational, command.")
+    return True
+
+
+def _cmd_pause(ctx: ShellContext, argument: str) -> bool:
+    ctx.runtime.safety.pause()
+    print("Safety: paused privileged actions.")
+    return True
+
+
+def _cmd_resume(ctx: ShellContext, argument: str) -> bool:
+    ctx.runtime.safety.resume()
+    print("Safety: resumed privileged actions.")
+    return True
+
+
+def _cmd_safety(ctx: ShellContext, argument: str) -> bool:
+    safety = ctx.runtime.safety
+    print(
+        f"Privilege={safety.privilege_level}, paused={safety.paused}, "
+        f"log={safety.log_path}"
+    )
+    return True
+
+
+_COMMANDS: Dict[str, CommandHandler] = {
+    "/exit": _cmd_exit,
+    "/clear": _cmd_clear,
+    "/persona": _cmd_persona,
+    "/model": _cmd_model,
+    "/history": _cmd_history,
+    "/tools": _cmd_tools,
+    "/consent": _cmd_consent,
+    "/revoke": _cmd_revoke,
+    "/prefs": _cmd_prefs,
+    "/pref": _cmd_pref,
+    "/priv": _cmd_priv,
+    "/pause": _cmd_pause,
+    "/resume": _cmd_resume,
+    "/safety": _cmd_safety,
+}
 
 
 def main() -> None:
@@ -88,13 +275,18 @@ def main() -> None:
     parser.add_argument(
         "--stream",
         action="store_true",
-        help="Stream responses word by word for a live typing feel.",
+        help="Print responses incrementally as the assistant generates them.",
     )
     parser.add_argument(
         "--stream-delay",
         type=float,
-        default=0.05,
-        help="Delay between streamed words when --stream is set.",
+        default=None,
+        help="Deprecated and ignored; streamed output follows real generation pace.",
+    )
+    parser.add_argument(
+        "--fake-typing",
+        action="store_true",
+        help="Add a typing animation between streamed chunks (terminal only).",
     )
     parser.add_argument(
         "--fast",
@@ -107,22 +299,39 @@ def main() -> None:
         help="Session identifier used for persistent memory.",
     )
     args = parser.parse_args()
+    if args.stream_delay is not None:
+        print("warning: --stream-delay is deprecated and ignored; use --fake-typing.", file=sys.stderr)
+    typing_delay = FAKE_TYPING_DELAY_S if args.fake_typing else 0.0
 
-    runtime = RobotRuntime()
+    config = RuntimeConfig()
+    # Turns are persisted by a background writer; shutdown() flushes the queue on exit.
+    config.memory.write_behind = True
+    runtime = RobotRuntime(config=config)
     runtime.assistant.ingest_documents(load_documents(args.docs))
-    tool_exec = runtime.assistant.tools
-    safety = runtime.safety
 
-    persona = args.persona
     session_id = args.session
-    stored_history = runtime.memory.get_recent_turns(session_id, runtime.config.memory.history_window * 2)
-    history: List[Dict[str, str]] = [
-        {"role": turn["role"], "content": turn["content"]}
-        for turn in stored_history
-    ]
-    preferences = runtime.memory.get_preferences(session_id)
-    fast_mode = args.fast
-    forced_model: Optional[str] = None
+    history_limit = runtime.config.memory.history_window * 2
+    stored_history = runtime.memory.get_recent_turns(
+        session_id, history_limit, fields=("role", "content")
+    )
+    # Bounded so long sessions keep constant memory; older turns stay in runtime.memory.
+    history: Deque[Dict[str, str]] = deque(stored_history, maxlen=history_limit)
+    ctx = ShellContext(
+        runtime=runtime,
+        session_id=session_id,
+        persona=args.persona,
+        fast_default=args.fast,
+        history=history,
+        preferences=runtime.memory.get_preferences(session_id),
+        fast_mode=args.fast,
+        turn_count=len(history) // 2,
+    )
+    ctx.intents_base = {
+        "skill": "assistant",
+        "instructions": ctx.persona,
+        "session_id": session_id,
+        "preferences": ctx.preferences,
+    }
 
     print("--- Assistant shell ---")
     print(
@@ -135,157 +344,62 @@ def main() -> None:
         print(f"(Loaded {len(history)} prior turns from memory)")
     print("Type your message and press Enter.")
 
-    while True:
-        try:
-            user_input = input("You> ").strip()
-        except (EOFError, KeyboardInterrupt):
-            print("\nExiting shell.")
-            break
+    # Session-constant part of the state; a fresh dict per turn keeps earlier
+    # payloads (e.g. get_runtime_state tool output) from changing underneath callers.
+    state_base = {"loop_rate_hz": runtime.config.loop_rate_hz}
 
-        if not user_input:
-            continue
-
-        if user_input.startswith("/"):
-            parts = user_input.split(maxsplit=1)
-            command = parts[0]
-            argument = parts[1] if len(parts) > 1 else ""
-
-            if command == "/exit":
-                print("Goodbye.")
+    try:
+        while True:
+            try:
+                user_input = input("You> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print("\nExiting shell.")
                 break
-            if command == "/clear":
-                history.clear()
-                print("History cleared.")
-                continue
-            if command == "/persona":
-                persona = argument or persona
-                print(f"Persona set to: {persona}")
-                continue
-            if command == "/model":
-                lookup = {
-                    "default": None,
-                    "fast": "fast",
-                    "offline": "offline",
-                }
-                key = argument.lower()
-                if key not in lookup:
-                    print("Valid options: default, fast, offline")
-                else:
-                    forced_model = lookup[key]
-                    if forced_model == "fast":
-                        fast_mode = True
-                    elif forced_model == "offline":
-                        fast_mode = False
-                    else:
-                        fast_mode = args.fast
-                    print(f"Model routing updated: {key}")
-                continue
-            if command == "/history":
-                if not history:
-                    print("(history empty)")
-                else:
-                    for turn in history:
-                        print(f"{turn['role']}: {turn['content']}")
-                continue
-            if command == "/tools":
-                for info in tool_exec.list_tools():
-                    status = "granted" if info["consent_granted"] else (
-                        "required" if info["requires_consent"] else "not-needed"
-                    )
-                    print(
-                        f"- {info['name']} [{info['category']}] "
-                        f"({status}) :: {info['description']}"
-                    )
-                continue
-            if command == "/consent":
-                if not argument:
-                    print("Usage: /consent <tool_name>")
-                else:
-                    tool_exec.grant_consent(argument)
-                    print(f"Consent granted for {argument}")
-                continue
-            if command == "/revoke":
-                if not argument:
-                    print("Usage: /revoke <tool_name>")
-                else:
-                    tool_exec.revoke_consent(argument)
-                    print(f"Consent revoked for {argument}")
-                continue
-            if command == "/prefs":
-                if not preferences:
-                    print("(no stored preferences)")
-                else:
-                    for key, value in preferences.items():
-                        print(f"- {key}: {value}")
-                continue
-            if command == "/pref":
-                if not argument or " " not in argument:
-                    print("Usage: /pref <key> <value>")
-                else:
-                    key, value = argument.split(" ", 1)
-                    runtime.memory.set_preference(session_id, key, value)
-                    preferences[key] = value
-                    print(f"Preference updated: {key}={value}")
-                continue
-            if command == "/priv":
-                if not argument:
-                    print("Usage: /priv <informational|command>")
-                else:
-                    try:
-                        safety.set_privilege(argument)
-                        print(f"Privilege set to {safety.privilege_level}")
-                    except ValueError:
-                        print("Invalid privilege level. Options: informational, command.")
-                continue
-            if command == "/pause":
-                safety.pause()
-                print("Safety: paused privileged actions.")
+
+            if not user_input:
                 continue
-            if command == "/resume":
-                safety.resume()
-                print("Safety: resumed privileged actions.")
+
+            if user_input.startswith("/"):
+                parts = user_input.split(maxsplit=1)
+                handler = _COMMANDS.get(parts[0])
+                if handler is None:
+                    print("Unknown command.")
+                    continue
+                if not handler(ctx, parts[1] if len(parts) > 1 else ""):
+                    break
                 continue
-            if command == "/safety":
-                print(
-                    f"Privilege={safety.privilege_level}, paused={safety.paused}, "
-                    f"log={safety.log_path}"
+
+            intents = ctx.intents_base.copy()
+            intents["query"] = user_input
+            intents["history"] = list(islice(history, max(0, len(history) - 8), None))
+            if ctx.fast_mode:
+                intents["fast_path"] = True
+            if ctx.forced_model == "offline":
+                intents["offline_only"] = True
+            if ctx.forced_model == "fast":
+                intents["fast_path"] = True
+
+            state = {**state_base, "turn": ctx.turn_count + 1}
+            if args.stream:
+                plan = stream_response(
+                    runtime.assistant.stream_handle(intents, state), delay=typing_delay
                 )
-                continue
+            else:
+                plan = runtime.assistant.handle(intents, state)
+            metadata = plan.get("metadata", {})
+            response = plan.get("response", "")
 
-            print("Unknown command.")
-            continue
-
-        intents = {
-            "skill": "assistant",
-            "query": user_input,
-            "history": history[-8:],
-            "instructions": persona,
-            "session_id": session_id,
-            "preferences": preferences,
-        }
-        if fast_mode:
-            intents["fast_path"] = True
-        if forced_model == "offline":
-            intents["offline_only"] = True
-        if forced_model == "fast":
-            intents["fast_path"] = True
-
-        state = {"loop_rate_hz": runtime.config.loop_rate_hz, "turn": len(history) // 2 + 1}
-        plan = runtime.assistant.handle(intents, state)
-        metadata = plan.get("metadata", {})
-        response = plan.get("response", "")
-
-        history.append({"role": "user", "content": user_input})
-        history.append({"role": "assistant", "content": response})
-
-        if args.stream:
-            stream_text(response, delay=args.stream_delay)
-        else:
-            wrapped = textwrap.fill(response, width=88)
-            print(f"Assistant> {wrapped}")
+            history.append({"role": "user", "content": user_input})
+            history.append({"role": "assistant", "content": response})
+            ctx.turn_count += 1
+
+            if not args.stream:
+                write_response(response)
 
-        if metadata:
-            print(f"  ▸ {format_metrics(metadata)}")
+            if metadata:
+                print(f"  ▸ {format_metrics(metadata)}")
+    finally:
+        runtime.shutdown()
 
 
 if __name__ == "__main__":
@@ -4,10 +4,15 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 
 import uvicorn
 
 
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--host", default="127.0.0.1", help="Bind address for the service.")
@@ -17,6 +22,15 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable auto-reload (only for local development).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes (ignored with --reload). Each worker keeps its own "
+            "config cache, so edits made through one worker are not seen by the others."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -27,6 +41,10 @@ def main() -> None:
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=1 if args.reload else max(1, args.workers),
+        # Prefer the C-accelerated event loop and HTTP parser from uvicorn[standard].
+        loop="uvloop" if _has_module("uvloop") else "asyncio",
+        http="httptools" if _has_module("httptools") else "h11",
     )
 
 
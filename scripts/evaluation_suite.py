@@ -8,7 +8,12 @@ import json
 import statistics
 import sys
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:  # pragma: no cover - optional faster serializer
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = REPO_ROOT / "src"
@@ -16,9 +21,12 @@ if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
 from robot_assistant.config.defaults import RuntimeConfig
-from robot_assistant.runtime.ai.retrieval import Document
+from robot_assistant.runtime.ai.tools import ToolResult
 from robot_assistant.runtime.system import RobotRuntime
 
+from _doc_cache import load_documents
+from _warmup import warm_up
+
 
 TEXT_SCENARIOS = [
     {
@@ -48,6 +56,12 @@ VOICE_SCENARIOS = [
     },
 ]
 
+# (name, spoken, expected, normalized expected) with normalization done once.
+VOICE_CASES: Tuple[Tuple[str, str, str, str], ...] = tuple(
+    (scenario["name"], scenario["spoken"], scenario["expected"], scenario["expected"].strip().casefold())
+    for scenario in VOICE_SCENARIOS
+)
+
 COMMAND_SCENARIOS = [
     {"name": "no_consent", "description": "issue_command without consent"},
     {"name": "paused", "description": "issue_command with consent while paused"},
@@ -55,71 +69,63 @@ COMMAND_SCENARIOS = [
 ]
 
 
-def load_documents(paths: Iterable[str]) -> List[Document]:
-    documents: List[Document] = []
-    for raw_path in paths:
-        path = Path(raw_path)
-        if not path.exists():
-            continue
-        documents.append(
-            Document(
-                doc_id=path.name,
-                content=path.read_text(),
-                metadata={"title": path.stem, "source_path": str(path)},
-            )
-        )
-    return documents
-
-
-def total_latency(metadata: Dict[str, Dict[str, float]]) -> float:
+def total_latency_ns(metadata: Dict[str, Dict[str, float]]) -> int:
+    """Sum stage latencies as integer nanoseconds to avoid float drift."""
     latency = metadata.get("latency_ms", {})
-    return float(sum(latency.values()))
+    return sum(round(value * 1_000_000) for value in latency.values())
+
+
+def run_text_scenario(runtime: RobotRuntime, scenario: Dict[str, str]) -> Dict[str, float]:
+    plan = runtime.assistant.handle(
+        {
+            "skill": "assistant",
+            "session_id": "eval_text",
+            "query": scenario["query"],
+            "instructions": "You are an analytical AI assistant evaluating system quality.",
+        },
+        {"scenario": scenario["name"]},
+    )
+    latency_ns = total_latency_ns(plan.get("metadata", {}))
+    return {"name": scenario["name"], "latency_ms": latency_ns / 1e6, "latency_ns": latency_ns}
 
 
 def run_text_scenarios(runtime: RobotRuntime) -> Tuple[List[Dict[str, float]], float]:
-    results: List[Dict[str, float]] = []
-    for scenario in TEXT_SCENARIOS:
-        plan = runtime.assistant.handle(
-            {
-                "skill": "assistant",
-                "session_id": "eval_text",
-                "query": scenario["query"],
-                "instructions": "You are an analytical AI assistant evaluating system quality.",
-            },
-            {"scenario": scenario["name"]},
-        )
-        latency = total_latency(plan.get("metadata", {}))
-        results.append({"name": scenario["name"], "latency_ms": latency})
-    average = statistics.mean(item["latency_ms"] for item in results)
+    results = [run_text_scenario(runtime, scenario) for scenario in TEXT_SCENARIOS]
+    average = statistics.mean(item["latency_ns"] for item in results) / 1e6
     return results, average
 
 
-def run_voice_scenarios(runtime: RobotRuntime) -> Tuple[List[Dict[str, float]], float]:
-    results: List[Dict[str, float]] = []
-    accuracy_hits = 0
-    for scenario in VOICE_SCENARIOS:
-        runtime.voice.enqueue_transcript(scenario["spoken"])
-        artifacts = runtime.step()
-        plan = artifacts.get("plan", {})
-        metadata = plan.get("metadata", {})
-        utterance = runtime.voice.last_utterance()
-        recognized = utterance.text if utterance else ""
-        expected = scenario["expected"]
-        accuracy = 1.0 if recognized.strip().lower() == expected.strip().lower() else 0.0
-        accuracy_hits += accuracy
-        results.append(
-            {
-                "name": scenario["name"],
-                "recognized": recognized,
-                "expected": expected,
-                "accuracy": accuracy,
-                "latency_ms": total_latency(metadata),
-            }
-        )
-    average_accuracy = accuracy_hits / max(1, len(VOICE_SCENARIOS))
+def run_voice_scenario(runtime: RobotRuntime, case: Tuple[str, str, str, str]) -> Dict[str, Any]:
+    name, spoken, expected, expected_norm = case
+    runtime.voice.enqueue_transcript(spoken)
+    artifacts = runtime.step()
+    plan = artifacts.get("plan", {})
+    metadata = plan.get("metadata", {})
+    utterance = runtime.voice.last_utterance()
+    recognized = utterance.text if utterance else ""
+    hit = int(recognized.strip().casefold() == expected_norm)
+    latency_ns = total_latency_ns(metadata)
+    return {
+        "name": name,
+        "recognized": recognized,
+        "expected": expected,
+        "accuracy": float(hit),
+        "latency_ms": latency_ns / 1e6,
+        "latency_ns": latency_ns,
+    }
+
+
+def run_voice_scenarios(runtime: RobotRuntime) -> Tuple[List[Dict[str, Any]], float]:
+    results = [run_voice_scenario(runtime, case) for case in VOICE_CASES]
+    accuracy_hits = sum(int(entry["accuracy"]) for entry in results)
+    average_accuracy = accuracy_hits / max(1, len(VOICE_CASES))
     return results, average_accuracy
 
 
+def _result_status(result: ToolResult) -> str:
+    return result.status or "error"
+
+
 def run_command_scenarios(runtime: RobotRuntime) -> Tuple[List[Dict[str, str]], float]:
     tool_exec = runtime.assistant.tools
     runtime.safety.set_privilege("informational")
@@ -128,14 +134,14 @@ def run_command_scenarios(runtime: RobotRuntime) -> Tuple[List[Dict[str, str]],
 
     # Scenario 1: missing consent
     result = tool_exec.run("issue_command", {"command": "diagnostics"}, {})
-    status = result.output["status"] if isinstance(result.output, dict) and "status" in result.output else "error"
+    status = _result_status(result)
     results.append({"name": "no_consent", "status": status, "error": result.error or ""})
 
     # Scenario 2: consent granted but safety paused
     tool_exec.grant_consent("issue_command")
     runtime.safety.pause()
     result = tool_exec.run("issue_command", {"command": "diagnostics"}, {})
-    status = result.output["status"] if isinstance(result.output, dict) and "status" in result.output else "error"
+    status = _result_status(result)
     results.append({"name": "paused", "status": status, "error": result.error or ""})
 
     # Scenario 3: fully authorized execution
@@ -143,13 +149,43 @@ def run_command_scenarios(runtime: RobotRuntime) -> Tuple[List[Dict[str, str]],
     runtime.safety.set_privilege("command")
     tool_exec.config.allow_control_commands = True
     result = tool_exec.run("issue_command", {"command": "diagnostics"}, {})
-    status = result.output["status"] if isinstance(result.output, dict) and "status" in result.output else "error"
+    status = _result_status(result)
     results.append({"name": "authorized", "status": status, "error": result.error or ""})
 
     success_rate = sum(1 for entry in results if entry["status"] == "accepted") / len(results)
     return results, success_rate
 
 
+def build_runtime(doc_paths: Iterable[str]) -> RobotRuntime:
+    config_runtime = RuntimeConfig()
+    config_runtime.tooling.allow_control_commands = True
+    config_runtime.tooling.allow_shell_commands = True
+    config_runtime.tooling.shell_allowlist = ["pwd"]
+
+    runtime = RobotRuntime(config=config_runtime)
+    runtime.assistant.ingest_documents(load_documents(doc_paths))
+    warm_up(runtime)
+    return runtime
+
+
+def evaluate(doc_paths: Iterable[str]) -> Tuple[Tuple[Any, Any], Tuple[Any, Any], Tuple[Any, Any]]:
+    """Run all scenario sets, one after another, against one warm runtime.
+
+    Scenarios run sequentially: they share the runtime's voice queue and text
+    session, and overlapping them would also skew each other's latencies.
+    Command scenarios run last because they toggle consent, privilege, and
+    pause state that the other scenarios depend on.
+    """
+    runtime = build_runtime(doc_paths)
+    try:
+        text = run_text_scenarios(runtime)
+        voice = run_voice_scenarios(runtime)
+        commands = run_command_scenarios(runtime)
+    finally:
+        runtime.shutdown()
+    return text, voice, commands
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -164,19 +200,11 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    config_runtime = RuntimeConfig()
-    config_runtime.tooling.allow_control_commands = True
-    config_runtime.tooling.allow_shell_commands = True
-    config_runtime.tooling.shell_allowlist = ["pwd"]
-
-    runtime = RobotRuntime(config=config_runtime)
-    runtime.assistant.ingest_documents(load_documents(args.docs))
-
-    text_results, avg_text_latency = run_text_scenarios(runtime)
-    voice_results, avg_voice_accuracy = run_voice_scenarios(runtime)
-    command_results, command_success_rate = run_command_scenarios(runtime)
-
-    runtime.shutdown()
+    (
+        (text_results, avg_text_latency),
+        (voice_results, avg_voice_accuracy),
+        (command_results, command_success_rate),
+    ) = evaluate(args.docs)
 
     summary = {
         "text": {"scenarios": text_results, "average_latency_ms": avg_text_latency},
@@ -184,27 +212,29 @@ def main() -> None:
         "commands": {"scenarios": command_results, "success_rate": command_success_rate},
     }
 
-    print("=== Text Scenarios ===")
-    for entry in text_results:
-        print(f"- {entry['name']}: latency={entry['latency_ms']:.2f} ms")
-    print(f"Average latency: {avg_text_latency:.2f} ms\n")
-
-    print("=== Voice Scenarios ===")
-    for entry in voice_results:
-        print(
-            f"- {entry['name']}: accuracy={entry['accuracy']:.2f}, latency={entry['latency_ms']:.2f} ms"
-        )
-    print(f"Average accuracy: {avg_voice_accuracy:.2f}\n")
-
-    print("=== Command Scenarios ===")
-    for entry in command_results:
-        print(f"- {entry['name']}: status={entry['status']} error={entry['error']}")
-    print(f"Success rate: {command_success_rate:.2f}")
+    lines: List[str] = ["=== Text Scenarios ==="]
+    lines.extend(f"- {entry['name']}: latency={entry['latency_ms']:.2f} ms" for entry in text_results)
+    lines.extend([f"Average latency: {avg_text_latency:.2f} ms", "", "=== Voice Scenarios ==="])
+    lines.extend(
+        f"- {entry['name']}: accuracy={entry['accuracy']:.2f}, latency={entry['latency_ms']:.2f} ms"
+        for entry in voice_results
+    )
+    lines.extend([f"Average accuracy: {avg_voice_accuracy:.2f}", "", "=== Command Scenarios ==="])
+    lines.extend(
+        f"- {entry['name']}: status={entry['status']} error={entry['error']}"
+        for entry in command_results
+    )
+    lines.append(f"Success rate: {command_success_rate:.2f}")
+    # One write for the whole report instead of a print per scenario.
+    sys.stdout.write("\n".join(lines) + "\n")
 
     if args.json:
         output_path = Path(args.json)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(summary, indent=2))
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(json.dumps(summary, indent=2))
 
 
 if __name__ == "__main__":
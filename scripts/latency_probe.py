@@ -6,32 +6,17 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
-from time import perf_counter
-from typing import Iterable, List
+from time import perf_counter_ns
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = REPO_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from robot_assistant.runtime.ai.retrieval import Document
 from robot_assistant.runtime.system import RobotRuntime
 
-
-def load_documents(paths: Iterable[str]) -> List[Document]:
-    documents: List[Document] = []
-    for raw_path in paths:
-        path = Path(raw_path)
-        if not path.exists():
-            continue
-        documents.append(
-            Document(
-                doc_id=path.name,
-                content=path.read_text(),
-                metadata={"title": path.stem, "source_path": str(path)},
-            )
-        )
-    return documents
+from _doc_cache import load_documents
+from _warmup import warm_up
 
 
 def main() -> None:
@@ -56,6 +41,8 @@ def main() -> None:
 
     runtime = RobotRuntime()
     runtime.assistant.ingest_documents(load_documents(args.docs))
+    # Untimed warmup so the measurement reflects steady state.
+    warm_up(runtime)
 
     intents = {
         "skill": "assistant",
@@ -64,12 +51,13 @@ def main() -> None:
     }
     state = {"loop_rate_hz": runtime.config.loop_rate_hz}
 
-    start = perf_counter()
+    start_ns = perf_counter_ns()
     plan = runtime.assistant.handle(intents, state)
-    total_ms = (perf_counter() - start) * 1000.0
+    total_ns = perf_counter_ns() - start_ns
+    total_ms = total_ns / 1e6
 
     metadata = plan.get("metadata", {})
-    print(f"Total latency: {total_ms:.2f} ms")
+    print(f"Total latency: {total_ms:.2f} ms ({total_ns} ns)")
 
     latency_breakdown = metadata.get("latency_ms", {})
     if latency_breakdown:
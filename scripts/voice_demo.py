@@ -6,31 +6,16 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
-from typing import Iterable, List
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = REPO_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from robot_assistant.runtime.ai.retrieval import Document
+from robot_assistant.config.defaults import RuntimeConfig
 from robot_assistant.runtime.system import RobotRuntime
 
-
-def load_documents(paths: Iterable[str]) -> List[Document]:
-    docs: List[Document] = []
-    for raw_path in paths:
-        path = Path(raw_path)
-        if not path.exists():
-            continue
-        docs.append(
-            Document(
-                doc_id=path.name,
-                content=path.read_text(),
-                metadata={"title": path.stem, "source_path": str(path)},
-            )
-        )
-    return docs
+from _doc_cache import load_documents
 
 
 def main() -> None:
@@ -53,13 +38,21 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    runtime = RobotRuntime()
+    config = RuntimeConfig()
+    # Reuse embeddings from the previous launch for documents that did not change.
+    config.retrieval.index_path = "var/retrieval_index"
+    runtime = RobotRuntime(config=config)
     runtime.assistant.ingest_documents(load_documents(args.docs))
 
     print("--- Voice demo ---")
     print(f"Type utterances to simulate speech, prefixed by wake word '{args.wake_word}'.")
     print(f"Use '{args.exit_cmd}' to stop.")
 
+    # Loop-invariant lookups bound once; the loop body runs per utterance.
+    exit_cmd = args.exit_cmd
+    enqueue = runtime.voice.enqueue_transcript
+    step = runtime.step
+
     while True:
         try:
             raw_input_text = input("You> ").strip()
@@ -70,12 +63,12 @@ def main() -> None:
         if not raw_input_text:
             continue
 
-        if raw_input_text == args.exit_cmd:
+        if raw_input_text == exit_cmd:
             print("Session terminated.")
             break
 
-        runtime.voice.enqueue_transcript(raw_input_text)
-        artifacts = runtime.step()
+        enqueue(raw_input_text)
+        artifacts = step()
         plan = artifacts.get("plan", {})
         response = plan.get("response")
         if response:
@@ -1,7 +1,7 @@
 """Default configuration definitions for the robot assistant."""
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 @dataclass
@@ -23,6 +23,14 @@ class RetrievalConfig:
     lexical_weight: float = 0.35
     vector_weight: float = 0.65
     min_score: float = 0.12
+    # "rrf" ranks by reciprocal rank fusion of the dense and lexical lists;
+    # "weighted" ranks by vector_weight * dense + lexical_weight * lexical.
+    fusion: str = "rrf"
+    rrf_k: int = 60
+    # Store embeddings as int8 (4x smaller) when NumPy is available.
+    quantize_embeddings: bool = False
+    # Persist the embedding index here (NumPy only) so restarts skip re-embedding.
+    index_path: Optional[str] = None
 
 
 @dataclass
@@ -46,6 +54,7 @@ class MemoryConfig:
 
     db_path: str = "var/memory.db"
     history_window: int = 8
+    write_behind: bool = False
 
 
 @dataclass
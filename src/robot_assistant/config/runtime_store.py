@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import copy
 import json
-from copy import deepcopy
-from dataclasses import fields, is_dataclass
+import os
+from dataclasses import fields
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type, TypeVar, Union
+
+try:  # pragma: no cover - optional faster serializer
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 from .defaults import (
     MemoryConfig,
@@ -20,8 +26,16 @@ from .defaults import (
 
 T = TypeVar("T")
 
+PathArg = Union[str, "os.PathLike[str]"]
+
 CONFIG_PATH = Path("var/runtime_config.json")
 
+# Parsed JSON per config file, keyed by path and validated by (mtime_ns, size)
+# so repeat loads of an unchanged file skip the read and parse. Bounded so a
+# process touching many paths (tests, per-profile configs) does not grow it.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_CONFIG_CACHE_SIZE = 8
+
 _NESTED_TYPES = {
     "models": ModelRoutingConfig,
     "retrieval": RetrievalConfig,
@@ -32,6 +46,31 @@ _NESTED_TYPES = {
 }
 
 
+# Per-class merge schema: the valid field names plus (name, nested config type
+# or None) for each field, so conversions skip reflection and nesting checks.
+_Schema = Tuple[FrozenSet[str], Tuple[Tuple[str, Optional[type]], ...]]
+
+
+def _build_schema(cls: type) -> _Schema:
+    cls_fields = fields(cls)
+    return (
+        frozenset(field.name for field in cls_fields),
+        tuple((field.name, _NESTED_TYPES.get(field.name)) for field in cls_fields),
+    )
+
+
+_SCHEMA: Dict[type, _Schema] = {
+    cls: _build_schema(cls) for cls in (RuntimeConfig, *_NESTED_TYPES.values())
+}
+
+
+def _schema_of(cls: type) -> _Schema:
+    entry = _SCHEMA.get(cls)
+    if entry is None:
+        entry = _SCHEMA[cls] = _build_schema(cls)
+    return entry
+
+
 def runtime_config_to_dict(config: RuntimeConfig) -> Dict[str, Any]:
     """Convert a RuntimeConfig to a JSON-ready dict."""
     return _dataclass_to_dict(config)
@@ -39,62 +78,122 @@ def runtime_config_to_dict(config: RuntimeConfig) -> Dict[str, Any]:
 
 def runtime_config_from_dict(data: Dict[str, Any], base: Optional[RuntimeConfig] = None) -> RuntimeConfig:
     """Construct a RuntimeConfig from a dict, merging with base defaults."""
+    # Deliberately not memoized: RuntimeConfig is mutable and callers edit the
+    # result in place, so a cached instance would have to be deep-copied on
+    # every hit, which costs about as much as this merge. Repeat file loads
+    # already skip the read and parse via _CONFIG_CACHE.
     base_config = base or RuntimeConfig()
     return _dict_to_dataclass(RuntimeConfig, data, base_config)
 
 
-def save_runtime_config(config: RuntimeConfig, path: Optional[Path] = None) -> None:
+def save_runtime_config(config: RuntimeConfig, path: Optional[PathArg] = None) -> None:
     """Persist configuration to disk as JSON."""
-    target = path or CONFIG_PATH
-    target.parent.mkdir(parents=True, exist_ok=True)
-    payload = runtime_config_to_dict(config)
-    target.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    save_runtime_config_dict(runtime_config_to_dict(config), path)
 
 
-def load_runtime_config(path: Optional[Path] = None, base: Optional[RuntimeConfig] = None) -> RuntimeConfig:
+def save_runtime_config_diff(
+    config: RuntimeConfig, base: Optional[RuntimeConfig] = None, path: Optional[PathArg] = None
+) -> None:
+    """Persist only the settings that differ from ``base`` (defaults when omitted).
+
+    Loading the file with the same base reproduces ``config``.
+    """
+    save_runtime_config_dict(_dataclass_diff(config, base or RuntimeConfig()), path)
+
+
+def save_runtime_config_dict(payload: Dict[str, Any], path: Optional[PathArg] = None) -> None:
+    """Persist an already serialized configuration.
+
+    For callers that keep ``runtime_config_to_dict`` output for a config they
+    never mutate, so saving does not walk the dataclass tree a second time.
+    """
+    target = os.fspath(path or CONFIG_PATH)
+    parent = os.path.dirname(target)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    if orjson is not None:
+        with open(target, "wb") as handle:
+            handle.write(orjson.dumps(payload))
+    else:
+        # Stream straight into the file buffer instead of building the string first;
+        # compact separators since the dashboard, not a text editor, edits this file.
+        with open(target, "w", encoding="utf-8", buffering=1 << 16) as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+    _CONFIG_CACHE.pop(target, None)
+
+
+def load_runtime_config(path: Optional[PathArg] = None, base: Optional[RuntimeConfig] = None) -> RuntimeConfig:
     """Load configuration from disk; return defaults when file is absent."""
-    source = path or CONFIG_PATH
+    # Plain string paths and os-level calls: no Path objects per reload.
+    source = os.fspath(path or CONFIG_PATH)
     base_config = base or RuntimeConfig()
-    if not source.exists():
+    # One handler covers the stat and the read, so a file removed in between
+    # also falls back to base instead of raising.
+    try:
+        stat = os.stat(source)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(source)
+        if cached is not None and cached[0] == signature:
+            data = cached[1]
+        else:
+            with open(source, "rb") as handle:
+                raw = handle.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("runtime configuration file must contain a JSON object")
+            _CONFIG_CACHE.pop(source, None)
+            if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+                del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+            _CONFIG_CACHE[source] = (signature, data)
+    except FileNotFoundError:
+        _CONFIG_CACHE.pop(source, None)
         return base_config
-    data = json.loads(source.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
-        raise ValueError("runtime configuration file must contain a JSON object")
     return runtime_config_from_dict(data, base_config)
 
 
 def _dataclass_to_dict(instance: Any) -> Dict[str, Any]:
     result: Dict[str, Any] = {}
-    for field in fields(instance):
-        value = getattr(instance, field.name)
-        if is_dataclass(value):
-            result[field.name] = _dataclass_to_dict(value)
+    for name, nested_cls in _schema_of(type(instance))[1]:
+        value = getattr(instance, name)
+        if nested_cls is not None:
+            result[name] = _dataclass_to_dict(value)
         else:
-            result[field.name] = value
+            result[name] = value
+    return result
+
+
+def _dataclass_diff(instance: Any, reference: Any) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for name, nested_cls in _schema_of(type(instance))[1]:
+        value = getattr(instance, name)
+        if nested_cls is not None:
+            nested = _dataclass_diff(value, getattr(reference, name))
+            if nested:
+                result[name] = nested
+        elif value != getattr(reference, name):
+            result[name] = value
     return result
 
 
 def _dict_to_dataclass(cls: Type[T], data: Dict[str, Any], base: Optional[T] = None) -> T:
     base_instance = base if base is not None else cls()
     kwargs: Dict[str, Any] = {}
-    valid_fields = {field.name for field in fields(cls)}
-    unknown = set(data.keys()) - valid_fields
+    valid_fields, schema = _schema_of(cls)
+    unknown = data.keys() - valid_fields
     if unknown:
         unknown_list = ", ".join(sorted(unknown))
         raise ValueError(f"Unknown fields for {cls.__name__}: {unknown_list}")
-    for field in fields(cls):
-        name = field.name
-        if name in _NESTED_TYPES:
-            nested_cls = _NESTED_TYPES[name]
+    for name, nested_cls in schema:
+        if nested_cls is not None:
             incoming = data.get(name) or {}
             nested_base = getattr(base_instance, name)
             kwargs[name] = _dict_to_dataclass(nested_cls, incoming, nested_base)
         else:
-            if name in data:
-                value = data[name]
-            else:
-                value = getattr(base_instance, name)
-                if isinstance(value, (dict, list)):
-                    value = deepcopy(value)
+            # Copy containers from either source: data may be a cached parse
+            # shared across loads, and base must not alias the result. Sections
+            # such as perception are free-form and may nest, so copy deeply.
+            value = data[name] if name in data else getattr(base_instance, name)
+            if isinstance(value, (dict, list)):
+                value = copy.deepcopy(value)
             kwargs[name] = value
     return cls(**kwargs)
@@ -6,10 +6,20 @@ import random
 import string
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from robot_assistant.config.defaults import RuntimeConfig
 
+try:  # pragma: no cover - optional acceleration
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python fallback
+    np = None
+
+
+# Upper bound on memoised routing decisions; arbitrary "model" overrides could
+# otherwise grow the cache without limit.
+_ROUTE_CACHE_SIZE = 64
+
 
 @dataclass
 class ModelSpec:
@@ -70,17 +80,40 @@ class ModelGateway:
                 fallback="gpt-4o-mini",
             ),
         }
+        self._route_cache: Dict[Tuple[Any, ...], ModelSpec] = {}
 
     def register_model(self, spec: ModelSpec) -> None:
         """Register or override a model specification."""
         self._catalog[spec.name] = spec
+        self._route_cache.clear()
 
     def get_spec(self, name: str) -> Optional[ModelSpec]:
         """Return the model spec if available."""
         return self._catalog.get(name)
 
     def select_model(self, intents: Dict[str, Any]) -> ModelSpec:
-        """Choose a model based on intent metadata and config policy."""
+        """Choose a model based on intent metadata and config policy.
+
+        Decisions are memoised per routing signature; the configured model names
+        are part of the key so config edits take effect immediately.
+        """
+        models = self.config.models
+        key = (
+            intents.get("model"),
+            bool(intents.get("fast_path", False)),
+            bool(intents.get("offline_only", False)),
+            models.default_model,
+            models.fast_model,
+            models.offline_model,
+        )
+        spec = self._route_cache.get(key)
+        if spec is None:
+            if len(self._route_cache) >= _ROUTE_CACHE_SIZE:
+                self._route_cache.clear()
+            spec = self._route_cache[key] = self._resolve_model(intents)
+        return spec
+
+    def _resolve_model(self, intents: Dict[str, Any]) -> ModelSpec:
         target = intents.get("model")
         if target and target in self._catalog:
             return self._catalog[target]
@@ -109,6 +142,28 @@ class ModelGateway:
         # Prototype simulates latency + token usage; replace with real API call.
         generated = self._simulate_response(prompt, spec)
         latency_ms = (perf_counter() - start_time) * 1000.0
+        return self._build_response(prompt, generated, spec, latency_ms)
+
+    def stream(self, prompt: str, intents: Dict[str, Any]) -> Generator[str, None, ModelResponse]:
+        """Yield completion text incrementally and return the final response.
+
+        Deltas concatenate to the full completion text; the normalized
+        ``ModelResponse`` is delivered as the generator's return value.
+        """
+        spec = self.select_model(intents)
+        start_time = perf_counter()
+        # Prototype replays the simulated completion word by word; a provider
+        # integration would forward its streamed deltas here and, like this,
+        # keep the time the consumer holds each delta out of latency_ms.
+        generated = self._simulate_response(prompt, spec)
+        latency_ms = (perf_counter() - start_time) * 1000.0
+        for idx, word in enumerate(generated.split(" ")):
+            yield word if idx == 0 else " " + word
+        return self._build_response(prompt, generated, spec, latency_ms)
+
+    def _build_response(
+        self, prompt: str, generated: str, spec: ModelSpec, latency_ms: float
+    ) -> ModelResponse:
         usage = {
             "prompt_tokens": self._estimate_tokens(prompt),
             "completion_tokens": self._estimate_tokens(generated),
@@ -125,21 +180,38 @@ class ModelGateway:
     def _simulate_response(self, prompt: str, spec: ModelSpec) -> str:
         """Prototype helper that fabricates a deterministic completion."""
         seed = abs(hash(prompt + spec.name)) % (2**32)
-        random.seed(seed)
         tokens = prompt.split()
         projected_len = min(len(tokens) // 2 + 32, spec.max_output_tokens)
-        synthetic_tokens = []
-        for _ in range(projected_len):
-            if tokens and random.random() > 0.6:
-                synthetic_tokens.append(random.choice(tokens))
-            else:
-                synthetic_tokens.append(self._random_token())
+        if np is not None:
+            synthetic_tokens = self._simulate_tokens_numpy(seed, tokens, projected_len)
+        else:
+            # A private generator leaves the global random state untouched.
+            rng = random.Random(seed)
+            synthetic_tokens = []
+            for _ in range(projected_len):
+                if tokens and rng.random() > 0.6:
+                    synthetic_tokens.append(rng.choice(tokens))
+                else:
+                    synthetic_tokens.append(self._random_token(rng))
         text = " ".join(synthetic_tokens)
         return text[: spec.max_output_tokens * 5]
 
     @staticmethod
-    def _random_token(length: int = 5) -> str:
-        return "".join(random.choice(string.ascii_lowercase) for _ in range(length))
+    def _simulate_tokens_numpy(seed: int, tokens: List[str], count: int, length: int = 5) -> List[str]:
+        """Draw every random letter and prompt-token pick in a few vectorised calls."""
+        rng = np.random.default_rng(seed)
+        letters = rng.integers(97, 123, size=count * length, dtype=np.uint8).tobytes().decode("ascii")
+        synthetic_tokens = [letters[start : start + length] for start in range(0, count * length, length)]
+        if tokens:
+            reuse = np.flatnonzero(rng.random(count) > 0.6)
+            picks = rng.integers(0, len(tokens), size=reuse.size)
+            for position, pick in zip(reuse.tolist(), picks.tolist()):
+                synthetic_tokens[position] = tokens[pick]
+        return synthetic_tokens
+
+    @staticmethod
+    def _random_token(rng: random.Random, length: int = 5) -> str:
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
 
     @staticmethod
     def _estimate_tokens(text: str) -> int:
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
 
 from robot_assistant.config.defaults import RuntimeConfig
 from robot_assistant.runtime.memory import ConversationMemory
@@ -44,7 +46,12 @@ class AssistantPipeline:
         self.model_gateway = model_gateway or ModelGateway(config)
         if retriever is None:
             embedder = EmbeddingProvider()
-            vector_store = InMemoryVectorStore(embedder)
+            index_path = config.retrieval.index_path
+            vector_store = InMemoryVectorStore(
+                embedder,
+                quantize=config.retrieval.quantize_embeddings,
+                persist_path=Path(index_path) if index_path else None,
+            )
             retriever = KnowledgeRetriever(vector_store, config.retrieval)
         self.retriever = retriever
         self.safety = safety or SafetyManager(config.safety)
@@ -57,16 +64,58 @@ class AssistantPipeline:
 
     def handle(self, intents: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """Process an intent payload and produce an assistant plan."""
+        query, prompt, tool_results, latency = self._prepare(intents, state)
+
+        with self.telemetry.track("generation", latency):
+            response = self.model_gateway.generate(prompt, intents)
+
+        return self._finalize(intents, query, response, tool_results, latency)
+
+    def stream_handle(
+        self, intents: Dict[str, Any], state: Dict[str, Any]
+    ) -> Generator[str, None, Dict[str, Any]]:
+        """Yield response text deltas as they are generated.
+
+        The assistant plan that ``handle`` would return is delivered as the
+        generator's return value once generation completes.
+        """
+        query, prompt, tool_results, latency = self._prepare(intents, state)
+
+        # Time only the model's work: the clock is stopped while each delta is
+        # with the consumer, which may print or pace the output.
+        stream = self.model_gateway.stream(prompt, intents)
+        generation_ms = 0.0
+        while True:
+            start = perf_counter()
+            try:
+                delta = next(stream)
+            except StopIteration as stop:
+                generation_ms += (perf_counter() - start) * 1000.0
+                response = stop.value
+                break
+            generation_ms += (perf_counter() - start) * 1000.0
+            yield delta
+        self.telemetry.record("generation", generation_ms, latency)
+
+        return self._finalize(intents, query, response, tool_results, latency)
+
+    def _prepare(
+        self, intents: Dict[str, Any], state: Dict[str, Any]
+    ) -> Tuple[Optional[str], str, List[ToolResult], Dict[str, float]]:
+        """Run retrieval and history lookup.
+
+        Returns the query, prompt, tool results, and the per-stage latency dict
+        (milliseconds) that later stages keep adding to.
+        """
         tool_results: List[ToolResult] = []
-        latency_summary: Dict[str, float] = {}
-        self.telemetry.flush()
+        latency: Dict[str, float] = {}
 
         session_id = intents.get("session_id", "default")
         query = intents.get("query") or intents.get("text") or intents.get("message")
 
         context_packages: List[Dict[str, Any]] = []
         if self.config.tooling.auto_search and query:
-            with self.telemetry.track("retrieval"):
+            with self.telemetry.track("retrieval", latency):
                 result = self.tools.run(
                     "search_docs",
                     params={"query": query, "limit": self.config.retrieval.top_k},
@@ -78,20 +127,27 @@ class AssistantPipeline:
 
         history = intents.get("history")
         if history is None and self.memory:
-            history = self.memory.get_recent_turns(session_id, self.config.memory.history_window)
+            history = self.memory.get_recent_turns(
+                session_id, self.config.memory.history_window, fields=("role", "content")
+            )
         if history is None:
             history = []
 
-        with self.telemetry.track("prompt_build"):
+        with self.telemetry.track("prompt_build", latency):
             prompt = self._build_prompt(query, intents, context_packages, state, history)
 
-        with self.telemetry.track("generation"):
-            response = self.model_gateway.generate(prompt, intents)
+        return query, prompt, tool_results, latency
 
-        for measurement in self.telemetry.flush():
-            latency_summary[measurement.stage] = latency_summary.get(
-                measurement.stage, 0.0
-            ) + measurement.duration_ms
+    def _finalize(
+        self,
+        intents: Dict[str, Any],
+        query: Optional[str],
+        response: ModelResponse,
+        tool_results: List[ToolResult],
+        latency_summary: Dict[str, float],
+    ) -> Dict[str, Any]:
+        """Assemble the assistant payload and persist the turn to memory."""
+        session_id = intents.get("session_id", "default")
 
         assistant_output = AssistantOutput(
             response=response.text,
@@ -113,28 +169,30 @@ class AssistantPipeline:
         }
 
         if self.memory:
-            if query:
-                self.memory.append_turn(
-                    session_id,
-                    "user",
-                    query,
-                    metadata=self._coerce_metadata(
-                        {
-                            "source": intents.get("source", "text"),
-                            "confidence": str(intents.get("confidence", "")),
-                        }
-                    ),
-                )
-            if assistant_output.response:
-                self.memory.append_turn(
-                    session_id,
-                    "assistant",
-                    assistant_output.response,
-                    metadata={"model": assistant_output.model},
-                )
-            preferences = intents.get("preferences", {})
-            for key, value in preferences.items():
-                self.memory.set_preference(session_id, key, str(value))
+            # One commit for the whole turn rather than one per row.
+            with self.memory.transaction():
+                if query:
+                    self.memory.append_turn(
+                        session_id,
+                        "user",
+                        query,
+                        metadata=self._coerce_metadata(
+                            {
+                                "source": intents.get("source", "text"),
+                                "confidence": str(intents.get("confidence", "")),
+                            }
+                        ),
+                    )
+                if assistant_output.response:
+                    self.memory.append_turn(
+                        session_id,
+                        "assistant",
+                        assistant_output.response,
+                        metadata={"model": assistant_output.model},
+                    )
+                preferences = intents.get("preferences", {})
+                for key, value in preferences.items():
+                    self.memory.set_preference(session_id, key, str(value))
 
         return payload
 
@@ -152,16 +210,17 @@ class AssistantPipeline:
 
         if history:
             sections.append("Conversation history (most recent first):")
-            for turn in history[-5:]:
-                speaker = turn.get("role", "user")
-                content = turn.get("content", "")
-                sections.append(f"{speaker}: {content}")
+            sections.extend(
+                f"{turn.get('role', 'user')}: {turn.get('content', '')}" for turn in history[-5:]
+            )
 
         if context_packages:
             sections.append("Context documents:")
-            for idx, package in enumerate(context_packages, 1):
-                title = package.get("metadata", {}).get("title", f"Doc {idx}")
-                sections.append(f"- [{package.get('doc_id')}] {title}: {package.get('content')}")
+            sections.extend(
+                f"- [{package.get('doc_id')}] "
+                f"{package.get('metadata', {}).get('title', f'Doc {idx}')}: {package.get('content')}"
+                for idx, package in enumerate(context_packages, 1)
+            )
 
         if state:
             sections.append(f"State summary: {state}")
@@ -2,13 +2,75 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import json
 import math
+import operator
+import os
+import re
+import zlib
 from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from robot_assistant.config.defaults import RetrievalConfig
 
+try:  # pragma: no cover - optional acceleration
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python fallback
+    np = None
+
+try:  # pragma: no cover - optional acceleration
+    from scipy import sparse
+except ImportError:  # pragma: no cover - postings-list fallback
+    sparse = None
+
+# Word characters only, so "memory," and "memory" share a token; shared by the
+# embedder and the lexical scorer.
+_TOKEN_RE = re.compile(r"\w+")
+
+
+# Bump when the embedding scheme changes so persisted indexes are rebuilt.
+_INDEX_FORMAT = 1
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _dot_python(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(map(operator.mul, a, b))
+
+
+# Pure-Python dot product for the no-NumPy path: math.sumprod (3.12+) runs in C,
+# and map(operator.mul) avoids a generator frame per element on older versions.
+_dot = getattr(math, "sumprod", _dot_python)
+
+
+def _top_indices(scores: Any, k: int) -> Any:
+    """Indices of the k highest scores, best first, ties to the lower index.
+
+    Same selection as ``heapq.nlargest`` over (index, score) pairs, but the
+    partition is O(N); ties straddling the k-th place are resolved by index
+    rather than left to ``argpartition``'s arbitrary choice.
+    """
+    if k < scores.size:
+        kth = np.partition(scores, scores.size - k)[scores.size - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[: k - above.size]
+        candidates = np.concatenate((above, ties))
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def _bucket(token: str) -> int:
+    # crc32 rather than hash(): str hashing is salted per process, and persisted
+    # vectors must match query embeddings computed after a restart.
+    return zlib.crc32(token.encode("utf-8"))
+
 
 @dataclass
 class Document:
@@ -31,51 +93,275 @@ class RetrievalResult:
 class EmbeddingProvider:
     """Lightweight embedding generator (placeholder for provider-backed embeddings)."""
 
-    def __init__(self, dimension: int = 64) -> None:
+    def __init__(self, dimension: int = 64, batch_size: int = 256) -> None:
+        if dimension <= 0 or dimension & (dimension - 1):
+            raise ValueError(f"Embedding dimension must be a power of two, got {dimension}")
         self.dimension = dimension
+        # Power-of-two dimension lets `hash & mask` stand in for `hash % dimension`.
+        self._mask = dimension - 1
+        # Largest number of texts a single provider request may carry.
+        self.batch_size = batch_size
+
+    def embed_batch(self, texts: Sequence[str]) -> Sequence[Sequence[float]]:
+        """Embed several texts in one call (one provider request per batch).
 
-    def embed(self, text: str) -> List[float]:
+        Returns a ``(len(texts), dimension)`` float32 array when NumPy is
+        available, otherwise a list of vectors.
+        """
+        if np is None:
+            return [self._embed_python(text) for text in texts]
+        token_lists = [self._tokenize(text) for text in texts]
+        counts = [len(tokens) for tokens in token_lists]
+        rows = np.repeat(np.arange(len(texts)), counts)
+        cols = np.fromiter(
+            (_bucket(token) & self._mask for tokens in token_lists for token in tokens),
+            dtype=np.int64,
+            count=len(rows),
+        )
+        # One histogram over flattened (row, column) cells fills the whole batch.
+        cells = np.bincount(rows * self.dimension + cols, minlength=len(texts) * self.dimension)
+        matrix = cells.reshape(len(texts), self.dimension).astype(np.float32)
+        # Rows are token counts, so any non-empty row has norm >= 1.
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1.0)
+        return matrix
+
+    def embed(self, text: str) -> Sequence[float]:
         """Produce a deterministic sparse embedding vector."""
+        if np is None:
+            return self._embed_python(text)
+        tokens = self._tokenize(text)
+        indices = np.fromiter((_bucket(token) & self._mask for token in tokens), dtype=np.int64, count=len(tokens))
+        vector = np.bincount(indices, minlength=self.dimension).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _embed_python(self, text: str) -> List[float]:
         vector = [0.0] * self.dimension
         tokens = self._tokenize(text)
         for token, count in Counter(tokens).items():
-            index = hash(token) % self.dimension
-            vector[index] += float(count)
+            vector[_bucket(token) & self._mask] += float(count)
         norm = math.sqrt(sum(v * v for v in vector)) or 1.0
         return [v / norm for v in vector]
 
-    @staticmethod
-    def _tokenize(text: str) -> List[str]:
-        return [token.lower() for token in text.split() if token]
+    _tokenize = staticmethod(_tokenize)
 
 
 class InMemoryVectorStore:
-    """Stores document embeddings in-process for experimentation."""
+    """Stores document embeddings in-process for experimentation.
+
+    With NumPy available the vectors live in one contiguous float32 matrix and a
+    search is a single matrix-vector product; otherwise rows are Python lists.
+    ``quantize=True`` stores rows as int8 with a per-row scale instead (a quarter
+    of the memory, small score error); it is a footprint option, since NumPy's
+    integer matmul is not faster than float32 BLAS.
 
-    def __init__(self, embedder: EmbeddingProvider) -> None:
+    ``persist_path`` (NumPy only) saves the matrix next to a JSON sidecar of ids
+    and content hashes; a later process memory-maps it and re-embeds only
+    documents whose content changed.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingProvider,
+        quantize: bool = False,
+        persist_path: Optional[Path] = None,
+    ) -> None:
         self.embedder = embedder
         self._docs: Dict[str, Document] = {}
-        self._vectors: Dict[str, List[float]] = {}
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._vectors: List[List[float]] = []
+        self._matrix = None
+        self._scales = None
+        self.quantized = quantize and np is not None
+        if np is not None:
+            dtype = np.int8 if self.quantized else np.float32
+            self._matrix = np.zeros((0, embedder.dimension), dtype=dtype)
+            self._scales = np.zeros(0, dtype=np.float32)
+        self.persist_path = Path(persist_path) if persist_path is not None and np is not None else None
+        self._content_hashes: Dict[str, str] = {}
+        # doc_id -> (content hash, row) in the memory-mapped index from a previous run.
+        self._persisted: Dict[str, Tuple[str, int]] = {}
+        self._persisted_matrix = None
+        self._persisted_scales = None
+        if self.persist_path is not None:
+            self._load_persisted()
 
     def add_documents(self, documents: Iterable[Document]) -> None:
         """Insert or replace documents in the vector store."""
-        for doc in documents:
-            self._docs[doc.doc_id] = doc
-            self._vectors[doc.doc_id] = self.embedder.embed(doc.content)
+        docs = list(documents)
+        batch_size = max(1, self.embedder.batch_size)
+        for offset in range(0, len(docs), batch_size):
+            batch = docs[offset : offset + batch_size]
+            vectors = self._embed_or_reuse(batch)
+            rows = [self._row_for(doc) for doc in batch]
+            if self._matrix is not None:
+                self._reserve(len(self._ids))
+                if self.quantized:
+                    self._matrix[rows], self._scales[rows] = self._quantize(vectors)
+                else:
+                    self._matrix[rows] = vectors
+            else:
+                for row, vector in zip(rows, vectors):
+                    self._vectors[row] = vector
+        if self.persist_path is not None and docs:
+            self._save_persisted()
+
+    def _embed_or_reuse(self, batch: List[Document]) -> Sequence[Sequence[float]]:
+        """Embed a batch, reusing persisted vectors for documents whose content is unchanged."""
+        contents = [doc.content for doc in batch]
+        if self.persist_path is None:
+            return self.embedder.embed_batch(contents)
+        vectors = np.zeros((len(batch), self.embedder.dimension), dtype=np.float32)
+        missing: List[int] = []
+        for idx, (doc, content) in enumerate(zip(batch, contents)):
+            digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+            self._content_hashes[doc.doc_id] = digest
+            persisted = self._persisted.get(doc.doc_id)
+            if persisted is not None and persisted[0] == digest:
+                vectors[idx] = self._persisted_vector(persisted[1])
+            else:
+                missing.append(idx)
+        if missing:
+            vectors[missing] = self.embedder.embed_batch([contents[idx] for idx in missing])
+        return vectors
+
+    def _persisted_vector(self, row: int) -> Any:
+        vector = np.asarray(self._persisted_matrix[row], dtype=np.float32)
+        if self._persisted_scales is not None:
+            # Re-quantising q * scale reproduces q exactly, since max |q| is 127.
+            vector = vector * self._persisted_scales[row]
+        return vector
+
+    def _index_files(self) -> Tuple[Path, Path, Path]:
+        base = self.persist_path
+        return base.with_suffix(".json"), base.with_suffix(".npy"), base.with_suffix(".scales.npy")
+
+    def _load_persisted(self) -> None:
+        meta_path, matrix_path, scales_path = self._index_files()
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            matrix = np.load(matrix_path, mmap_mode="r")
+            scales = np.load(scales_path, mmap_mode="r") if meta.get("quantized") else None
+        except (OSError, ValueError):
+            return
+        ids, hashes = meta.get("ids", []), meta.get("hashes", [])
+        if (
+            meta.get("format") != _INDEX_FORMAT
+            or meta.get("embedder") != type(self.embedder).__name__
+            or matrix.shape != (len(ids), self.embedder.dimension)
+            or len(hashes) != len(ids)
+        ):
+            return
+        self._persisted = {doc_id: (digest, row) for row, (doc_id, digest) in enumerate(zip(ids, hashes))}
+        self._persisted_matrix = matrix
+        self._persisted_scales = scales
+
+    def _save_persisted(self) -> None:
+        meta_path, matrix_path, scales_path = self._index_files()
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        count = len(self._ids)
+        self._atomic_write(matrix_path, lambda fh: np.save(fh, self._matrix[:count]))
+        if self.quantized:
+            self._atomic_write(scales_path, lambda fh: np.save(fh, self._scales[:count]))
+        meta = {
+            "format": _INDEX_FORMAT,
+            "embedder": type(self.embedder).__name__,
+            "dimension": self.embedder.dimension,
+            "quantized": self.quantized,
+            "ids": self._ids,
+            "hashes": [self._content_hashes.get(doc_id, "") for doc_id in self._ids],
+        }
+        # Sidecar last: a reader only trusts the matrix once ids describe it.
+        self._atomic_write(meta_path, lambda fh: fh.write(json.dumps(meta).encode("utf-8")))
 
-    def similarity_search(self, query: str, top_k: int = 4) -> List[Tuple[Document, float]]:
-        """Return the top_k documents based on cosine similarity."""
+    @staticmethod
+    def _atomic_write(path: Path, write: Any) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as fh:
+            write(fh)
+        os.replace(tmp_path, path)
+
+    def _row_for(self, document: Document) -> int:
+        """Return the storage row for a document, allocating one for new ids."""
+        self._docs[document.doc_id] = document
+        row = self._rows.get(document.doc_id)
+        if row is None:
+            row = self._rows[document.doc_id] = len(self._ids)
+            self._ids.append(document.doc_id)
+            if self._matrix is None:
+                self._vectors.append([])
+        return row
+
+    def get(self, doc_id: str) -> Optional[Document]:
+        """Return a stored document by id."""
+        return self._docs.get(doc_id)
+
+    def similarity_search(
+        self, query: str, top_k: int = 4, min_score: Optional[float] = None
+    ) -> List[Tuple[Document, float]]:
+        """Return the top_k documents based on cosine similarity, optionally at least ``min_score``."""
+        if self._matrix is not None:
+            return self._similarity_search_matrix(query, top_k, min_score)
         query_vec = self.embedder.embed(query)
-        scored: List[Tuple[Document, float]] = []
-        for doc_id, vector in self._vectors.items():
-            score = self._cosine_similarity(query_vec, vector)
-            scored.append((self._docs[doc_id], score))
-        scored.sort(key=lambda pair: pair[1], reverse=True)
-        return scored[:top_k]
+        scored = (
+            (self._docs[doc_id], self._cosine_similarity(query_vec, vector))
+            for doc_id, vector in zip(self._ids, self._vectors)
+        )
+        if min_score is not None:
+            scored = (pair for pair in scored if pair[1] >= min_score)
+        return heapq.nlargest(top_k, scored, key=lambda pair: pair[1])
+
+    def _similarity_search_matrix(
+        self, query: str, top_k: int, min_score: Optional[float]
+    ) -> List[Tuple[Document, float]]:
+        count = len(self._ids)
+        if count == 0 or top_k <= 0:
+            return []
+        query_vec = np.asarray(self.embedder.embed(query), dtype=np.float32)
+        # Embeddings are unit-normalised, so the inner product is the cosine.
+        if self.quantized:
+            query_q, query_scale = self._quantize(query_vec[None, :])
+            scores = np.matmul(self._matrix[:count], query_q[0], dtype=np.int32)
+            scores = scores * self._scales[:count] * query_scale[0]
+        else:
+            scores = self._matrix[:count] @ query_vec
+        rows = np.arange(count)
+        if min_score is not None:
+            # Threshold as one vectorised comparison; only survivors are ranked.
+            rows = np.flatnonzero(scores >= min_score)
+            scores = scores[rows]
+            if rows.size == 0:
+                return []
+        # rows is ascending, so ties resolve by insertion order like the list path.
+        top = _top_indices(scores, min(top_k, rows.size))
+        return [(self._docs[self._ids[rows[idx]]], float(scores[idx])) for idx in top]
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the backing matrix geometrically so appends stay amortised O(1)."""
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        size = max(rows, capacity * 2, 16)
+        grown = np.zeros((size, self.embedder.dimension), dtype=self._matrix.dtype)
+        grown[:capacity] = self._matrix
+        self._matrix = grown
+        scales = np.zeros(size, dtype=np.float32)
+        scales[:capacity] = self._scales
+        self._scales = scales
+
+    @staticmethod
+    def _quantize(vectors):
+        """Symmetric per-row int8 quantisation: row ~= q * scale."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+        return quantized, scales
 
     @staticmethod
     def _cosine_similarity(a: List[float], b: List[float]) -> float:
-        return sum(x * y for x, y in zip(a, b))
+        return _dot(a, b)
 
 
 class KnowledgeRetriever:
@@ -84,46 +370,182 @@ class KnowledgeRetriever:
     def __init__(self, store: InMemoryVectorStore, config: RetrievalConfig) -> None:
         self.store = store
         self.config = config
+        # doc_id -> (token counts, total tokens), built once at ingest time.
+        self._lex_index: Dict[str, Tuple[Counter, int]] = {}
+        # token -> doc_ids containing it, so lexical ranking only scores overlaps.
+        self._postings: Dict[str, Set[str]] = {}
+        # Ingest order of lexical entries; also the row order of the sparse matrix.
+        self._lex_ids: List[str] = []
+        self._lex_rows: Dict[str, int] = {}
+        # With SciPy: token -> column, and a CSR doc x term count matrix rebuilt
+        # lazily after ingest.
+        self._vocab: Dict[str, int] = {}
+        self._term_matrix = None
+        self._doc_totals = None
 
     def ingest(self, documents: Iterable[Document]) -> None:
         """Populate the knowledge base."""
-        self.store.add_documents(documents)
+        docs = list(documents)
+        self.store.add_documents(docs)
+        for doc in docs:
+            previous = self._lex_index.get(doc.doc_id)
+            if previous is not None:
+                for token in previous[0]:
+                    self._postings[token].discard(doc.doc_id)
+            else:
+                self._lex_rows[doc.doc_id] = len(self._lex_ids)
+                self._lex_ids.append(doc.doc_id)
+            entry = self._lex_index[doc.doc_id] = self._lexical_entry(doc.content)
+            for token in entry[0]:
+                self._postings.setdefault(token, set()).add(doc.doc_id)
+                if token not in self._vocab:
+                    self._vocab[token] = len(self._vocab)
+        self._term_matrix = None
 
     def retrieve(self, query: str, top_k: Optional[int] = None) -> List[RetrievalResult]:
-        """Fetch documents ordered by combined lexical + vector score."""
+        """Fetch documents ordered by the configured fusion of lexical and vector scores."""
         top_k = top_k or self.config.top_k
-        dense_results = self.store.similarity_search(query, top_k * 3)
+        candidates = top_k * 3
         query_tokens = Counter(self._tokenize(query))
-        scored: List[RetrievalResult] = []
+        query_total = sum(query_tokens.values())
+        if self.config.fusion == "rrf":
+            dense_results = self.store.similarity_search(query, candidates, self.config.min_score)
+            return self._fuse_rrf(dense_results, query_tokens, query_total, candidates, top_k)
 
+        dense_results = self.store.similarity_search(query, candidates)
+        vector_weight, lexical_weight = self.config.vector_weight, self.config.lexical_weight
+        scored = []
         for document, dense_score in dense_results:
-            lexical_score = self._lexical_score(query_tokens, document.content)
-            combined = (
-                self.config.vector_weight * dense_score
-                + self.config.lexical_weight * lexical_score
+            lexical_score = self._lexical_score(query_tokens, query_total, document)
+            combined = vector_weight * dense_score + lexical_weight * lexical_score
+            if combined >= self.config.min_score:
+                scored.append((combined, document, dense_score, lexical_score))
+        # Results are only materialised for the top_k survivors.
+        return [
+            RetrievalResult(
+                document=document,
+                score=combined,
+                components={"vector": dense_score, "lexical": lexical_score},
             )
-            if combined < self.config.min_score:
-                continue
-            scored.append(
-                RetrievalResult(
-                    document=document,
-                    score=combined,
-                    components={"vector": dense_score, "lexical": lexical_score},
-                )
+            for combined, document, dense_score, lexical_score in heapq.nlargest(
+                top_k, scored, key=lambda entry: entry[0]
             )
+        ]
 
-        scored.sort(key=lambda result: result.score, reverse=True)
-        return scored[:top_k]
+    def _fuse_rrf(
+        self,
+        dense_results: List[Tuple[Document, float]],
+        query_tokens: Counter,
+        query_total: int,
+        candidates: int,
+        top_k: int,
+    ) -> List[RetrievalResult]:
+        """Reciprocal rank fusion: sum 1 / (rrf_k + rank) over the dense and lexical lists.
 
-    @staticmethod
-    def _lexical_score(query_tokens: Counter, content: str) -> float:
-        doc_tokens = Counter(KnowledgeRetriever._tokenize(content))
-        intersection = sum(min(query_tokens[token], doc_tokens.get(token, 0)) for token in query_tokens)
-        union = sum(query_tokens.values()) + sum(doc_tokens.values()) - intersection
+        Ranks are scale-free, so cosine and overlap scores need no weighting.
+        ``dense_results`` arrive already pruned to min_score by the store;
+        lexical hits must share a token.
+        """
+        rrf_k = self.config.rrf_k
+        # doc_id -> [fused score, document, dense score, lexical score]
+        fused: Dict[str, list] = {}
+        for rank, (document, dense_score) in enumerate(dense_results, 1):
+            fused[document.doc_id] = [1.0 / (rrf_k + rank), document, dense_score, 0.0]
+        lexical_hits = self._lexical_search(query_tokens, query_total, candidates)
+        for rank, (document, lexical_score) in enumerate(lexical_hits, 1):
+            entry = fused.get(document.doc_id)
+            if entry is None:
+                fused[document.doc_id] = [1.0 / (rrf_k + rank), document, 0.0, lexical_score]
+            else:
+                entry[0] += 1.0 / (rrf_k + rank)
+                entry[3] = lexical_score
+        ranked = heapq.nlargest(top_k, fused.values(), key=lambda entry: (entry[0], entry[2]))
+        return [
+            RetrievalResult(
+                document=document,
+                score=score,
+                components={"vector": dense_score, "lexical": lexical_score},
+            )
+            for score, document, dense_score, lexical_score in ranked
+        ]
+
+    def _lexical_search(
+        self, query_tokens: Counter, query_total: int, top_k: int
+    ) -> List[Tuple[Document, float]]:
+        """Rank ingested documents that share at least one token with the query."""
+        if sparse is not None and self._lex_ids:
+            return self._lexical_search_sparse(query_tokens, query_total, top_k)
+        doc_ids: Set[str] = set()
+        for token in query_tokens:
+            doc_ids.update(self._postings.get(token, ()))
+        scored = []
+        # Ingest order, so equal lexical scores rank deterministically.
+        for doc_id in sorted(doc_ids, key=self._lex_rows.__getitem__):
+            document = self.store.get(doc_id)
+            if document is not None:
+                scored.append((document, self._lexical_score(query_tokens, query_total, document)))
+        return heapq.nlargest(top_k, scored, key=lambda pair: pair[1])
+
+    def _lexical_search_sparse(
+        self, query_tokens: Counter, query_total: int, top_k: int
+    ) -> List[Tuple[Document, float]]:
+        """Score every document at once as min-pooled overlap on a sparse term matrix."""
+        terms = [(self._vocab[token], count) for token, count in query_tokens.items() if token in self._vocab]
+        if not terms or top_k <= 0:
+            return []
+        if self._term_matrix is None:
+            self._build_term_matrix()
+        columns = np.fromiter((col for col, _ in terms), dtype=np.int64, count=len(terms))
+        query_counts = np.fromiter((count for _, count in terms), dtype=np.float64, count=len(terms))
+        # Column slice keeps only query terms; clipping each stored count to the
+        # query count and summing per row gives the multiset intersection.
+        overlap = self._term_matrix[:, columns].tocsr()
+        overlap.data = np.minimum(overlap.data, query_counts[overlap.indices])
+        intersection = np.asarray(overlap.sum(axis=1)).ravel()
+        rows = np.flatnonzero(intersection)
+        if rows.size == 0:
+            return []
+        scores = intersection[rows] / (query_total + self._doc_totals[rows] - intersection[rows])
+        top = _top_indices(scores, min(top_k, rows.size))
+        results = []
+        for idx in top:
+            document = self.store.get(self._lex_ids[rows[idx]])
+            if document is not None:
+                results.append((document, float(scores[idx])))
+        return results
+
+    def _build_term_matrix(self) -> None:
+        indptr = [0]
+        indices: List[int] = []
+        data: List[int] = []
+        totals: List[int] = []
+        for doc_id in self._lex_ids:
+            counts, total = self._lex_index[doc_id]
+            indices.extend(self._vocab[token] for token in counts)
+            data.extend(counts.values())
+            indptr.append(len(indices))
+            totals.append(total)
+        self._term_matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), indices, indptr),
+            shape=(len(self._lex_ids), len(self._vocab)),
+        )
+        self._doc_totals = np.asarray(totals, dtype=np.float64)
+
+    def _lexical_score(self, query_tokens: Counter, query_total: int, document: Document) -> float:
+        entry = self._lex_index.get(document.doc_id)
+        if entry is None:
+            # Documents added to the store directly bypass ingest().
+            entry = self._lexical_entry(document.content)
+        doc_tokens, doc_total = entry
+        intersection = sum(min(count, doc_tokens.get(token, 0)) for token, count in query_tokens.items())
+        union = query_total + doc_total - intersection
         if union == 0:
             return 0.0
         return intersection / union
 
-    @staticmethod
-    def _tokenize(text: str) -> List[str]:
-        return [token.lower() for token in text.split() if token]
+    @classmethod
+    def _lexical_entry(cls, content: str) -> Tuple[Counter, int]:
+        doc_tokens = Counter(cls._tokenize(content))
+        return doc_tokens, sum(doc_tokens.values())
+
+    _tokenize = staticmethod(_tokenize)
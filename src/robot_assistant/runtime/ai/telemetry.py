@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Dict, Iterable, List
+from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class StageMeasurement:
     """Individual timing measurement for a named stage."""
 
@@ -16,34 +15,76 @@ class StageMeasurement:
     duration_ms: float
 
 
+class _StageTimer:
+    """Reusable context manager behind ``LatencyProbe.track``.
+
+    A plain ``__enter__``/``__exit__`` pair avoids the generator machinery of
+    ``contextlib.contextmanager`` on every timed block.
+    """
+
+    __slots__ = ("probe", "stage", "sink", "start")
+
+    def __init__(self, probe: "LatencyProbe") -> None:
+        self.probe = probe
+        self.stage = ""
+        self.sink: Optional[Dict[str, float]] = None
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.probe._record(self, (perf_counter() - self.start) * 1000.0)
+
+
 class LatencyProbe:
     """Collects stage-level latency metrics for diagnostic usage."""
 
     def __init__(self) -> None:
         self._measurements: List[StageMeasurement] = []
+        # Running per-stage totals so summary() never rescans the measurements.
+        self._sums: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._pool: List[_StageTimer] = []
+
+    def track(self, stage: str, sink: Optional[Dict[str, float]] = None) -> _StageTimer:
+        """Context manager that records elapsed time for a block.
 
-    @contextmanager
-    def track(self, stage: str) -> Iterable[None]:
-        """Context manager that records elapsed time for a block."""
-        start = perf_counter()
+        With ``sink``, the duration is added to ``sink[stage]`` directly instead
+        of being queued for ``flush``.
+        """
+        # EAFP: another thread may take the last pooled timer between a check and pop().
         try:
-            yield
-        finally:
-            duration_ms = (perf_counter() - start) * 1000.0
+            timer = self._pool.pop()
+        except IndexError:
+            timer = _StageTimer(self)
+        timer.stage = stage
+        timer.sink = sink
+        return timer
+
+    def record(self, stage: str, duration_ms: float, sink: Optional[Dict[str, float]] = None) -> None:
+        """Record a duration measured outside ``track``, with the same ``sink`` rules."""
+        if sink is not None:
+            sink[stage] = sink.get(stage, 0.0) + duration_ms
+        else:
             self._measurements.append(StageMeasurement(stage=stage, duration_ms=duration_ms))
+            self._sums[stage] = self._sums.get(stage, 0.0) + duration_ms
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    def _record(self, timer: _StageTimer, duration_ms: float) -> None:
+        self.record(timer.stage, duration_ms, timer.sink)
+        timer.sink = None
+        self._pool.append(timer)
 
     def flush(self) -> List[StageMeasurement]:
         """Return and clear collected measurements."""
         measurements = list(self._measurements)
         self._measurements.clear()
+        self._sums.clear()
+        self._counts.clear()
         return measurements
 
     def summary(self) -> Dict[str, float]:
         """Aggregate measurements by stage (average duration)."""
-        aggregates: Dict[str, List[float]] = {}
-        for item in self._measurements:
-            aggregates.setdefault(item.stage, []).append(item.duration_ms)
-        return {
-            stage: sum(values) / len(values)
-            for stage, values in aggregates.items()
-        }
+        counts = self._counts
+        return {stage: total / counts[stage] for stage, total in self._sums.items()}
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
 import shlex
 import subprocess
+import threading
 from dataclasses import dataclass, field
-from pathlib import Path
 from time import perf_counter
-from typing import Any, Callable, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set
 
 from robot_assistant.config.defaults import ToolingConfig
 from robot_assistant.runtime.ai.retrieval import KnowledgeRetriever, RetrievalResult
@@ -16,8 +19,48 @@ from robot_assistant.runtime.safety import SafetyManager
 
 ToolHandler = Callable[["ToolContext"], Any]
 
-
-@dataclass
+# Metadata shared by every result on the constant error paths of ToolExecutor.run;
+# result metadata is read-only for callers.
+_NO_METADATA: Dict[str, Any] = {}
+_CONSENT_REQUIRED_METADATA: Dict[str, Any] = {"requires_consent": True}
+
+# Characters of stdout/stderr kept from a shell command; the rest is discarded.
+_SHELL_OUTPUT_CAP = 2048
+
+
+def _read_capped(stream: IO[str], sink: List[str]) -> None:
+    """Drain ``stream``, keeping only its first ``_SHELL_OUTPUT_CAP`` characters."""
+    kept = 0
+    with stream:
+        for chunk in iter(lambda: stream.read(4096), ""):
+            if kept < _SHELL_OUTPUT_CAP:
+                chunk = chunk[: _SHELL_OUTPUT_CAP - kept]
+                sink.append(chunk)
+                kept += len(chunk)
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every file under ``root`` with one scandir per directory."""
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        files: List[os.DirEntry] = []
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry)
+        except OSError:
+            continue
+        yield from files
+        # Reversed so subdirectories are visited in scandir order (depth-first).
+        pending.extend(reversed(subdirs))
+
+
+@dataclass(slots=True)
 class ToolContext:
     """Context object passed into tool handlers."""
 
@@ -26,7 +69,7 @@ class ToolContext:
     retriever: Optional[KnowledgeRetriever] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents the outcome of a tool execution."""
 
@@ -36,9 +79,11 @@ class ToolResult:
     latency_ms: float
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Mirrors output["status"] when the handler reports one (e.g. "accepted", "blocked").
+    status: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     """Metadata wrapper for a registered tool."""
 
@@ -51,23 +96,6 @@ class Tool:
     category: str = "general"
 
 
-class ConsentRegistry:
-    """Tracks user consent for privileged tool execution."""
-
-    def __init__(self) -> None:
-        self._consent: Dict[str, bool] = {}
-
-    def grant(self, tool_name: str) -> None:
-        self._consent[tool_name] = True
-
-    def revoke(self, tool_name: str) -> None:
-        if tool_name in self._consent:
-            del self._consent[tool_name]
-
-    def has(self, tool_name: str) -> bool:
-        return self._consent.get(tool_name, False)
-
-
 class ToolExecutor:
     """Executes registered tools with timing, safety checks, and consent tracking."""
 
@@ -80,8 +108,10 @@ class ToolExecutor:
         self.retriever = retriever
         self.config = config
         self._tools: Dict[str, Tool] = {}
-        self._consent = ConsentRegistry()
+        # Names of privileged tools the user has consented to.
+        self._consent: Set[str] = set()
         self.safety = safety
+        self._shell_allowlist = frozenset(config.shell_allowlist or ())
         self._register_builtin_tools()
 
     def _register_builtin_tools(self) -> None:
@@ -177,20 +207,26 @@ class ToolExecutor:
                 "description": tool.description,
                 "requires_consent": tool.requires_consent,
                 "category": tool.category,
-                "consent_granted": self._consent.has(tool.name),
+                "consent_granted": tool.name in self._consent,
             }
             for tool in self._tools.values()
         ]
 
     def grant_consent(self, name: str) -> None:
         """Grant consent for a privileged tool."""
-        self._consent.grant(name)
+        self._consent.add(name)
 
     def revoke_consent(self, name: str) -> None:
         """Revoke consent for a privileged tool."""
-        self._consent.revoke(name)
+        self._consent.discard(name)
 
-    def run(self, name: str, params: Dict[str, Any], state: Dict[str, Any]) -> ToolResult:
+    def run(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        state: Dict[str, Any],
+        _clock: Callable[[], float] = perf_counter,
+    ) -> ToolResult:
         """Execute a tool by name."""
         tool = self._tools.get(name)
         if not tool:
@@ -200,16 +236,17 @@ class ToolExecutor:
                 output=None,
                 latency_ms=0.0,
                 error=f"tool '{name}' not registered",
+                metadata=_NO_METADATA,
             )
 
-        if tool.requires_consent and not self._consent.has(tool.name):
+        if tool.requires_consent and tool.name not in self._consent:
             return ToolResult(
                 name=name,
                 success=False,
                 output=None,
                 latency_ms=0.0,
                 error="consent required",
-                metadata={"requires_consent": True},
+                metadata=_CONSENT_REQUIRED_METADATA,
             )
 
         if self.safety:
@@ -234,10 +271,11 @@ class ToolExecutor:
                         "blocked": True,
                         "reason": status.reason,
                     },
+                    status="blocked",
                 )
 
         context = ToolContext(params=params, state_snapshot=state, retriever=self.retriever)
-        start_time = perf_counter()
+        start_time = _clock()
         try:
             output = tool.handler(context)
             success = True
@@ -246,7 +284,7 @@ class ToolExecutor:
             output = None
             success = False
             error = str(exc)
-        latency_ms = (perf_counter() - start_time) * 1000.0
+        latency_ms = (_clock() - start_time) * 1000.0
 
         result = ToolResult(
             name=name,
@@ -255,6 +293,7 @@ class ToolExecutor:
             latency_ms=latency_ms,
             error=error,
             metadata={"requires_consent": tool.requires_consent, "category": tool.category},
+            status=output.get("status") if isinstance(output, dict) else None,
         )
         if self.safety:
             outcome = "success" if success else "error"
@@ -295,32 +334,43 @@ class ToolExecutor:
         raw_command = context.params.get("command")
         if not raw_command:
             return {"status": "rejected", "reason": "missing command"}
-        if isinstance(raw_command, str):
-            argv = shlex.split(raw_command)
-        else:
-            argv = list(raw_command)
+        argv = shlex.split(raw_command) if isinstance(raw_command, str) else list(raw_command)
         if not argv:
             return {"status": "rejected", "reason": "empty command"}
-        if argv[0] not in self.config.shell_allowlist:
+        if argv[0] not in self._shell_allowlist:
             return {"status": "rejected", "reason": "command not in allowlist"}
         try:
-            process = subprocess.run(
-                argv,
-                check=False,
-                capture_output=True,
-                text=True,
-                timeout=max(1.0, self.config.max_tool_time_ms / 1000.0),
+            process = subprocess.Popen(
+                argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
             )
         except Exception as exc:
             return {"status": "error", "error": str(exc)}
-        stdout = process.stdout[:2048]
-        stderr = process.stderr[:2048]
+        # Reader threads drain both pipes so the child never blocks on a full
+        # pipe, while memory stays bounded by the cap however much it prints.
+        stdout: List[str] = []
+        stderr: List[str] = []
+        readers = [
+            threading.Thread(target=_read_capped, args=(process.stdout, stdout), daemon=True),
+            threading.Thread(target=_read_capped, args=(process.stderr, stderr), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            returncode = process.wait(timeout=max(1.0, self.config.max_tool_time_ms / 1000.0))
+        except subprocess.TimeoutExpired as exc:
+            process.kill()
+            process.wait()
+            return {"status": "error", "error": str(exc)}
+        finally:
+            for reader in readers:
+                # Bounded in case a grandchild still holds the pipes open.
+                reader.join(timeout=1.0)
         return {
             "status": "ok",
             "command": argv,
-            "returncode": process.returncode,
-            "stdout": stdout,
-            "stderr": stderr,
+            "returncode": returncode,
+            "stdout": "".join(stdout),
+            "stderr": "".join(stderr),
         }
 
     def _search_files(self, context: ToolContext) -> Dict[str, Any]:
@@ -328,27 +378,32 @@ class ToolExecutor:
         limit = int(context.params.get("limit", 10))
         patterns_param = context.params.get("patterns") or ["*"]
         patterns: List[str] = patterns_param if isinstance(patterns_param, list) else [patterns_param]
+        # "*" (the default) accepts every name, so skip per-file matching for it.
+        match_all = "*" in patterns
+        matchers = [re.compile(fnmatch.translate(pattern)).match for pattern in patterns if pattern != "*"]
         results: List[Dict[str, Any]] = []
         for root in self.config.file_search_roots:
-            root_path = Path(root).expanduser()
-            if not root_path.exists():
+            root_path = os.path.expanduser(root)
+            if not os.path.isdir(root_path):
                 continue
-            for pattern in patterns:
-                for path in root_path.rglob(pattern):
-                    if not path.is_file():
-                        continue
-                    if query and query not in path.name.lower():
-                        continue
-                    stat = path.stat()
-                    results.append(
-                        {
-                            "path": str(path),
-                            "size": stat.st_size,
-                            "modified": stat.st_mtime,
-                        }
-                    )
-                    if len(results) >= limit:
-                        break
+            for entry in _walk_files(root_path):
+                name = entry.name
+                if query and query not in name.lower():
+                    continue
+                if not match_all and not any(match(name) for match in matchers):
+                    continue
+                # Only matches pay for a stat() call.
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                results.append(
+                    {
+                        "path": entry.path,
+                        "size": stat.st_size,
+                        "modified": stat.st_mtime,
+                    }
+                )
                 if len(results) >= limit:
                     break
             if len(results) >= limit:
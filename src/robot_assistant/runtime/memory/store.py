@@ -3,16 +3,90 @@
 from __future__ import annotations
 
 import json
+import logging
+import queue
 import sqlite3
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from robot_assistant.config.defaults import MemoryConfig
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Columns get_recent_turns can project, in their default order.
+TURN_FIELDS = ("role", "content", "metadata", "created_at")
+
+# Maximum queued writes committed together by the write-behind thread.
+_WRITE_BATCH = 16
+
+# WAL lets readers proceed during writes and, with synchronous=NORMAL, commits
+# no longer fsync the main database file on every turn.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Fixed statement text so sqlite3's per-connection statement cache reuses the
+# prepared statements.
+_SELECT_NEXT_INDICES_SQL = "SELECT session_id, MAX(turn_index) FROM conversation_turns GROUP BY session_id"
+_SELECT_NEXT_INDEX_SQL = (
+    "SELECT COALESCE(MAX(turn_index), -1) + 1 FROM conversation_turns WHERE session_id = ?"
+)
+# Plain INSERT: a clash means another writer owns that index, never an update.
+_INSERT_TURN_SQL = (
+    "INSERT INTO conversation_turns "
+    "(session_id, turn_index, role, content, metadata, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_UPSERT_PREFERENCE_SQL = (
+    "INSERT OR REPLACE INTO preferences (session_id, key, value, updated_at) VALUES (?, ?, ?, ?)"
+)
+_SELECT_PREFERENCES_SQL = "SELECT key, value FROM preferences WHERE session_id = ?"
+
+_WriteOp = Tuple[Callable[[sqlite3.Connection, Tuple[Any, ...]], None], Tuple[Any, ...]]
+
+
+def _as_op(
+    writer: Callable[[sqlite3.Connection, Tuple[Any, ...]], None], record: Tuple[Any, ...]
+) -> _WriteOp:
+    return writer, record
+
+
+def _run_ops(conn: sqlite3.Connection, ops: Tuple[_WriteOp, ...]) -> None:
+    for writer, record in ops:
+        writer(conn, record)
+
+
+@lru_cache(maxsize=None)
+def _recent_turns_sql(fields: Tuple[str, ...]) -> str:
+    # One stable statement text per projection keeps the statement cache warm.
+    return (
+        f"SELECT {', '.join(fields)} FROM conversation_turns "
+        "WHERE session_id = ? ORDER BY turn_index DESC LIMIT ?"
+    )
+
+
+@lru_cache(maxsize=None)
+def _field_positions(fields: Tuple[str, ...]) -> Tuple[int, ...]:
+    return tuple(TURN_FIELDS.index(name) for name in fields)
+
+
+@lru_cache(maxsize=4096)
+def _load_metadata(raw: str) -> Dict[str, str]:
+    # Shared across calls: callers get a copy, never this dict itself.
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+
+
+@dataclass(slots=True)
 class MemoryTurn:
     """Structured representation of a stored conversation turn."""
 
@@ -23,17 +97,72 @@ class MemoryTurn:
 
 
 class ConversationMemory:
-    """Provides short-term buffers backed by persistent SQLite storage."""
+    """Provides short-term buffers backed by persistent SQLite storage.
+
+    With ``config.write_behind`` enabled, writes are queued and committed by a
+    background thread on its own connection so callers never wait on disk.
+    The last ``history_window`` turns of each session are also kept in memory,
+    so ``get_recent_turns`` within that window sees queued writes immediately
+    and skips SQLite; deeper reads and ``get_preferences`` flush the queue
+    first. When a batch fails to commit, the writer retries it one write at a
+    time; a write that still fails is logged and dropped, the windows and turn
+    indices are rebuilt from SQLite, and the error is raised from the next
+    ``flush`` or ``close``.
+
+    Turn indices are allocated in-process. When another ConversationMemory on
+    the same database has taken an index, the insert is retried past that
+    session's highest stored turn and the session's window is reloaded on the
+    next read; until such a clash, a window does not reflect other writers.
+
+    The instance may be shared across threads. Reads and synchronous writes
+    share one connection, and every use of it is serialized by one lock, so a
+    reader never sees another thread's uncommitted writes.
+    """
 
     def __init__(self, config: MemoryConfig) -> None:
         self.config = config
         self.db_path = Path(config.db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn = self._connect()
         self._conn.row_factory = sqlite3.Row
         self._ensure_schema()
+        # Next turn index per session, seeded once so appends skip a MAX() query.
+        self._next_index: Dict[str, int] = {
+            row[0]: row[1] + 1
+            for row in self._conn.execute(_SELECT_NEXT_INDICES_SQL)
+        }
+        # Newest turns per session as (role, content, metadata JSON, created_at),
+        # filled from SQLite the first time a session is touched.
+        self._recent: Dict[str, Deque[Tuple[Any, ...]]] = {}
+        # Sessions another writer also appended to; their windows are reloaded.
+        self._stale: Set[str] = set()
+        # Serializes all use of the shared connection, index allocation and
+        # the windows; a write holds it until its commit.
+        self._write_lock = threading.RLock()
+        # Per-thread list of writes buffered by an open transaction() block.
+        self._local = threading.local()
+        self._write_queue: Optional["queue.Queue[Optional[_WriteOp]]"] = None
+        self._writer: Optional[threading.Thread] = None
+        # First failure of the write-behind thread, raised by flush()/close().
+        self._writer_error: Optional[BaseException] = None
+        if config.write_behind:
+            self._write_queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._drain_writes, name="memory-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
     def _ensure_schema(self) -> None:
+        # WITHOUT ROWID clusters rows by primary key, so the recent-turns query is
+        # a backwards range scan on (session_id, turn_index) that reads no
+        # separate rowid b-tree and needs no sort. Existing databases keep the
+        # schema they were created with.
         cursor = self._conn.cursor()
         cursor.execute(
             """
@@ -45,7 +174,7 @@ class ConversationMemory:
                 metadata TEXT,
                 created_at REAL NOT NULL,
                 PRIMARY KEY (session_id, turn_index)
-            )
+            ) WITHOUT ROWID
             """
         )
         cursor.execute(
@@ -56,7 +185,7 @@ class ConversationMemory:
                 value TEXT NOT NULL,
                 updated_at REAL NOT NULL,
                 PRIMARY KEY (session_id, key)
-            )
+            ) WITHOUT ROWID
             """
         )
         self._conn.commit()
@@ -67,85 +196,249 @@ class ConversationMemory:
         role: str,
         content: str,
         metadata: Optional[Dict[str, str]] = None,
+        _now: Callable[[], float] = time.time,
     ) -> None:
         """Persist a conversation turn."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT COALESCE(MAX(turn_index), -1) FROM conversation_turns WHERE session_id = ?",
-            (session_id,),
-        )
-        next_index = cursor.fetchone()[0] + 1
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO conversation_turns
-            (session_id, turn_index, role, content, metadata, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                session_id,
-                next_index,
-                role,
-                content,
-                json.dumps(metadata or {}),
-                time.time(),
-            ),
-        )
-        self._conn.commit()
+        payload = json.dumps(metadata or {})
+        self._submit(self._stage_turn, (session_id, role, content, payload, _now()))
+
+    def _stage_turn(
+        self, session_id: str, role: str, content: str, payload: str, created_at: float
+    ) -> _WriteOp:
+        # Runs under _write_lock, when the write is applied rather than buffered.
+        recent = self._recent.get(session_id)
+        if recent is None:
+            recent = self._load_recent(session_id)
+        turn_index = self._next_index.get(session_id, 0)
+        self._next_index[session_id] = turn_index + 1
+        recent.append((role, content, payload, created_at))
+        return self._insert_turn, (session_id, turn_index, role, content, payload, created_at)
+
+    def _load_recent(self, session_id: str) -> Deque[Tuple[Any, ...]]:
+        """Seed the in-memory window for a session from SQLite."""
+        with self._write_lock:
+            recent = self._recent.get(session_id)
+            if recent is None:
+                rows = self._conn.execute(
+                    _recent_turns_sql(TURN_FIELDS), (session_id, self.config.history_window)
+                ).fetchall()
+                recent = deque(
+                    (tuple(row) for row in reversed(rows)), maxlen=self.config.history_window
+                )
+                self._recent[session_id] = recent
+            return recent
+
+    def _insert_turn(self, conn: sqlite3.Connection, record: Tuple[Any, ...]) -> None:
+        try:
+            conn.execute(_INSERT_TURN_SQL, record)
+            return
+        except sqlite3.IntegrityError:
+            pass
+        # Another instance wrote this session. The failed INSERT left this
+        # connection holding the write lock, so MAX() and the retry cannot race.
+        session_id = record[0]
+        (turn_index,) = conn.execute(_SELECT_NEXT_INDEX_SQL, (session_id,)).fetchone()
+        conn.execute(_INSERT_TURN_SQL, (session_id, turn_index, *record[2:]))
+        with self._write_lock:
+            if self._next_index.get(session_id, 0) <= turn_index:
+                self._next_index[session_id] = turn_index + 1
+            self._stale.add(session_id)
 
-    def get_recent_turns(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, str]]:
-        """Return the latest turns for a session."""
+    def get_recent_turns(
+        self,
+        session_id: str,
+        limit: Optional[int] = None,
+        fields: Sequence[str] = TURN_FIELDS,
+    ) -> List[Dict[str, Any]]:
+        """Return the latest turns for a session, keeping only the requested ``fields``."""
+        unknown = set(fields) - set(TURN_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown turn fields: {sorted(unknown)}")
         limit = limit or self.config.history_window
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            SELECT role, content, metadata, created_at
-            FROM conversation_turns
-            WHERE session_id = ?
-            ORDER BY turn_index DESC
-            LIMIT ?
-            """,
-            (session_id, limit),
-        )
-        rows = cursor.fetchall()
-        turns: List[Dict[str, str]] = []
-        for row in reversed(rows):
-            metadata = {}
-            if row["metadata"]:
-                try:
-                    metadata = json.loads(row["metadata"])
-                except json.JSONDecodeError:
-                    metadata = {}
-            turns.append(
-                {
-                    "role": row["role"],
-                    "content": row["content"],
-                    "metadata": metadata,
-                    "created_at": row["created_at"],
-                }
-            )
+        if session_id in self._stale:
+            # Let the writer finish the clashing batch, then reload from SQLite.
+            self.flush()
+            with self._write_lock:
+                self._stale.discard(session_id)
+                self._recent.pop(session_id, None)
+        in_window = limit <= self.config.history_window
+        if not in_window:
+            # Older turns live only in SQLite, which lags the write queue.
+            self.flush()
+        with self._write_lock:
+            if in_window:
+                recent = self._recent.get(session_id)
+                if recent is None:
+                    recent = self._load_recent(session_id)
+                positions = _field_positions(tuple(fields))
+                rows = [tuple(row[i] for i in positions) for row in list(recent)[-limit:]]
+            else:
+                cursor = self._conn.cursor()
+                cursor.execute(_recent_turns_sql(tuple(fields)), (session_id, limit))
+                rows = cursor.fetchall()[::-1]
+        decode_metadata = "metadata" in fields
+        turns: List[Dict[str, Any]] = []
+        for row in rows:
+            turn = dict(zip(fields, row))
+            if decode_metadata:
+                raw = turn["metadata"]
+                turn["metadata"] = dict(_load_metadata(raw)) if raw else {}
+            turns.append(turn)
         return turns
 
     def set_preference(self, session_id: str, key: str, value: str) -> None:
         """Persist a preference for a session."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO preferences (session_id, key, value, updated_at)
-            VALUES (?, ?, ?, ?)
-            """,
-            (session_id, key, value, time.time()),
-        )
-        self._conn.commit()
+        self._write(self._upsert_preference, (session_id, key, value, time.time()))
+
+    @staticmethod
+    def _upsert_preference(conn: sqlite3.Connection, record: Tuple[Any, ...]) -> None:
+        conn.execute(_UPSERT_PREFERENCE_SQL, record)
 
     def get_preferences(self, session_id: str) -> Dict[str, str]:
         """Return all stored preferences for a session."""
-        cursor = self._conn.cursor()
-        cursor.execute(
-            "SELECT key, value FROM preferences WHERE session_id = ?",
-            (session_id,),
-        )
-        return {row["key"]: row["value"] for row in cursor.fetchall()}
+        self.flush()
+        with self._write_lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SELECT_PREFERENCES_SQL, (session_id,))
+            rows = cursor.fetchall()
+        return {row["key"]: row["value"] for row in rows}
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Apply every write made inside the block at once.
+
+        Writes are buffered for the calling thread and applied when the
+        outermost block exits cleanly: as one commit, or in write-behind mode
+        as a single queued batch. An exception discards them. Nested blocks
+        join the outermost one, and reads inside the block do not see its
+        buffered writes.
+        """
+        local = self._local
+        if getattr(local, "pending", None) is not None:
+            yield
+            return
+        staged: List[Tuple[Callable[..., _WriteOp], Tuple[Any, ...]]] = []
+        local.pending = staged
+        try:
+            yield
+        finally:
+            local.pending = None
+        if staged:
+            self._apply(staged)
+
+    def flush(self) -> None:
+        """Block until every queued write has been handled.
+
+        Raises the error of any batch the writer failed to commit since the
+        last ``flush``.
+        """
+        if self._write_queue is not None:
+            self._write_queue.join()
+            self._raise_writer_error()
 
     def close(self) -> None:
-        """Close the underlying database connection."""
+        """Flush pending writes and close the underlying database connection."""
+        if self._writer is not None and self._write_queue is not None:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
         self._conn.close()
+        self._raise_writer_error()
+
+    def _raise_writer_error(self) -> None:
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            raise RuntimeError("write-behind batch failed to commit") from error
+
+    def _write(
+        self,
+        writer: Callable[[sqlite3.Connection, Tuple[Any, ...]], None],
+        record: Tuple[Any, ...],
+    ) -> None:
+        self._submit(_as_op, (writer, record))
+
+    def _submit(self, stage: Callable[..., _WriteOp], args: Tuple[Any, ...]) -> None:
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append((stage, args))
+        else:
+            self._apply(((stage, args),))
+
+    def _apply(self, staged: Sequence[Tuple[Callable[..., _WriteOp], Tuple[Any, ...]]]) -> None:
+        with self._write_lock:
+            ops = [stage(*args) for stage, args in staged]
+            if self._write_queue is not None:
+                # A single queue item, so the writer commits the group together.
+                self._write_queue.put(ops[0] if len(ops) == 1 else (_run_ops, tuple(ops)))
+                return
+            try:
+                for writer, record in ops:
+                    writer(self._conn, record)
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                # Windows may hold the failed turns; they reload lazily.
+                self._recent.clear()
+                raise
+
+    def _forget_uncommitted(self, conn: sqlite3.Connection) -> None:
+        """Rebuild windows and turn indices from SQLite after a dropped write."""
+        with self._write_lock:
+            # The windows may hold dropped turns. Marking their sessions stale
+            # makes the next read flush first, so a window reloaded while
+            # later turns are still queued is replaced before it is read.
+            self._stale.update(self._recent)
+            self._recent.clear()
+            self._next_index = {
+                row[0]: row[1] + 1 for row in conn.execute(_SELECT_NEXT_INDICES_SQL)
+            }
+
+    def _replay_writes(self, conn: sqlite3.Connection, ops: Sequence[_WriteOp]) -> None:
+        """Retry a failed batch one commit per op so a bad write drops only itself.
+
+        A ``transaction()`` group is a single op here, so it stays atomic. A
+        failed op is logged and dropped rather than wedging every later write;
+        the thread must survive or ``flush()`` never returns.
+        """
+        dropped = False
+        for writer, record in ops:
+            try:
+                writer(conn, record)
+                conn.commit()
+            except Exception as exc:
+                logger.exception("memory writer dropped a write")
+                conn.rollback()
+                dropped = True
+                if self._writer_error is None:
+                    self._writer_error = exc
+        if dropped:
+            self._forget_uncommitted(conn)
+
+    def _drain_writes(self) -> None:
+        """Write-behind loop: commit queued writes in batches on a dedicated connection."""
+        assert self._write_queue is not None
+        conn = self._connect()
+        try:
+            stop = False
+            while not stop:
+                batch = [self._write_queue.get()]
+                while len(batch) < _WRITE_BATCH:
+                    try:
+                        batch.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                # Decided up front so a failed batch cannot swallow close()'s sentinel.
+                stop = None in batch
+                ops = [op for op in batch if op is not None]
+                try:
+                    for writer, record in ops:
+                        writer(conn, record)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    self._replay_writes(conn, ops)
+                finally:
+                    for _ in batch:
+                        self._write_queue.task_done()
+        finally:
+            conn.close()
@@ -4,17 +4,23 @@ from __future__ import annotations
 
 import json
 import time
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Tuple
 
 from robot_assistant.config.defaults import SafetyConfig
 
+try:  # pragma: no cover - optional faster serializer
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
-_COMMAND_CATEGORIES = {"control", "system", "home_automation"}
 
+_COMMAND_CATEGORIES = frozenset({"control", "system", "home_automation"})
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SafetyStatus:
     """Result of privilege enforcement."""
 
@@ -22,6 +28,12 @@ class SafetyStatus:
     reason: str = ""
 
 
+# is_allowed hands out these shared instances instead of allocating per call.
+_ALLOWED = SafetyStatus(True, "")
+_PAUSED = SafetyStatus(False, "safety_paused")
+_INSUFFICIENT_PRIVILEGE = SafetyStatus(False, "insufficient_privilege")
+
+
 class SafetyManager:
     """Centralizes privilege state, pause control, and audit logging."""
 
@@ -31,6 +43,12 @@ class SafetyManager:
         self.paused = config.pause_on_start
         self.log_path = Path(config.audit_log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        # One unbuffered append handle for the manager's lifetime; every event
+        # reaches the file as a single write of one complete line.
+        self._log_handle = self.log_path.open("ab", buffering=0)
+        # Closes the handle at exit or when the manager is collected, without
+        # keeping the manager alive the way an atexit registration would.
+        self._close_log = weakref.finalize(self, self._log_handle.close)
 
     def set_privilege(self, level: str) -> None:
         """Update the privilege level."""
@@ -43,6 +61,16 @@ class SafetyManager:
             detail={"level": self.privilege_level},
         )
 
+    @property
+    def privilege_level(self) -> str:
+        """Current privilege tier; assigning it also updates the tool guard."""
+        return self._privilege_level
+
+    @privilege_level.setter
+    def privilege_level(self, level: str) -> None:
+        self._privilege_level = level
+        self._refresh_guard()
+
     def pause(self) -> None:
         """Pause privileged actions."""
         self.paused = True
@@ -56,23 +84,34 @@ class SafetyManager:
     def is_allowed(self, tool_category: str) -> SafetyStatus:
         """Check whether a tool category is allowed under current settings."""
         if self.paused:
-            return SafetyStatus(False, "safety_paused")
-        if self.privilege_level == "informational" and tool_category in _COMMAND_CATEGORIES:
-            return SafetyStatus(False, "insufficient_privilege")
-        return SafetyStatus(True, "")
+            return _PAUSED
+        if tool_category in self._forbidden:
+            return _INSUFFICIENT_PRIVILEGE
+        return _ALLOWED
+
+    def _refresh_guard(self) -> None:
+        """Recompute the categories the current privilege level forbids."""
+        self._forbidden = _COMMAND_CATEGORIES if self.privilege_level == "informational" else frozenset()
 
     def log_tool(self, name: str, category: str, outcome: str, metadata: Dict[str, str]) -> None:
         """Append a tool execution event to the audit log."""
         detail = {"tool": name, "category": category, "outcome": outcome, **metadata}
         self._log_event(event="tool", detail=detail)
 
+    def close(self) -> None:
+        """Close the audit log handle."""
+        self._close_log()
+
     def _log_event(self, event: str, detail: Dict[str, str]) -> None:
         payload = {
-            "ts": time.time(),
+            "ts": time.time_ns(),  # integer nanoseconds since the epoch
             "event": event,
             "detail": detail,
             "privilege": self.privilege_level,
             "paused": self.paused,
         }
-        with self.log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
+        if orjson is not None:
+            line = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(payload) + "\n").encode("utf-8")
+        self._log_handle.write(line)
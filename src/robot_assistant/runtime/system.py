@@ -39,6 +39,8 @@ class RobotRuntime:
         self.controller = controller or Controller(self.hardware, self.config)
         self.skills = skills or SkillRegistry(self.planner, self.controller)
         self.voice = voice or VoiceOrchestrator(self.config)
+        # Injected voice stacks may not implement shutdown; resolve that once.
+        self._voice_shutdown = getattr(self.voice, "shutdown", None)
         self.safety = safety or SafetyManager(self.config.safety)
         self.memory = memory or ConversationMemory(self.config.memory)
         self.interface = interface or InteractionProtocol(self.voice)
@@ -50,22 +52,29 @@ class RobotRuntime:
             safety=self.safety,
         )
         self.skills.register("assistant", self.assistant.handle)
+        # Resolve the per-tick call chain once; step() runs at the loop rate.
+        self._read_sensors = self.hardware.read_sensors
+        self._perceive = self.perception.process
+        self._poll_intents = self.interface.poll_intents
+        self._dispatch = self.skills.dispatch
+        self._execute = self.controller.execute
+        self._apply_commands = self.hardware.apply_commands
+        self._push_feedback = self.interface.push_feedback
 
     def step(self) -> Dict[str, Any]:
         """Run one perception-planning-control loop and return artifacts."""
-        observations = self.hardware.read_sensors()
-        state = self.perception.process(observations)
-        intents = self.interface.poll_intents()
-        plan = self.skills.dispatch(intents, state)
-        control_commands = self.controller.execute(plan, state)
-        self.hardware.apply_commands(control_commands)
-        self.interface.push_feedback(state, control_commands)
+        state = self._perceive(self._read_sensors())
+        plan = self._dispatch(self._poll_intents(), state)
+        control_commands = self._execute(plan, state)
+        self._apply_commands(control_commands)
+        self._push_feedback(state, control_commands)
         return {"state": state, "plan": plan, "commands": control_commands}
 
     def shutdown(self) -> None:
         """Gracefully stop the runtime."""
         self.interface.close()
         self.hardware.shutdown()
-        if hasattr(self.voice, "shutdown"):
-            self.voice.shutdown()
+        if self._voice_shutdown is not None:
+            self._voice_shutdown()
         self.memory.close()
+        self.safety.close()
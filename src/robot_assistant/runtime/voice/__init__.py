@@ -1,12 +1,14 @@
 """Voice interface helpers for speech recognition, wake words, and synthesis."""
 
+from typing import Any
+
+from . import orchestrator
 from .orchestrator import (
     RecognizedUtterance,
     SpeechRecognizer,
     WakeWordDetector,
     SpeechSynthesizer,
     VoiceOrchestrator,
-    HAS_MAC_SPEECH,
 )
 
 __all__ = [
@@ -17,7 +19,11 @@ __all__ = [
     "VoiceOrchestrator",
 ]
 
-if HAS_MAC_SPEECH:  # pragma: no cover - optional
-    from .orchestrator import MacSpeechRecognizer, MacSpeechSynthesizer
 
-    __all__.extend(["MacSpeechRecognizer", "MacSpeechSynthesizer"])
+def __getattr__(name: str) -> Any:
+    # Native voice names resolve lazily so importing the package never loads PyObjC.
+    if name == "HAS_MAC_SPEECH":
+        return orchestrator._load_mac_speech()
+    if name in ("MacSpeechRecognizer", "MacSpeechSynthesizer") and orchestrator._load_mac_speech():
+        return getattr(orchestrator, name)  # pragma: no cover - optional
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,36 +3,83 @@
 from __future__ import annotations
 
 import queue
+import sys
 import time
 from collections import deque
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Deque, Dict, Optional, Tuple, Any
+from typing import Deque, Dict, List, Optional, Tuple, Any
 
 import os
 
 from robot_assistant.config.defaults import RuntimeConfig, VoiceConfig
 
-try:  # pragma: no cover - optional macOS dependency
-    import objc  # type: ignore  # noqa: F401
-    from Cocoa import NSSpeechSynthesizer, NSRunLoop, NSDate  # type: ignore
-    from Foundation import NSLocale  # type: ignore
-    from AVFoundation import AVAudioEngine, AVAudioSession  # type: ignore
-    from Speech import (  # type: ignore
-        SFSpeechRecognizer,
-        SFSpeechAudioBufferRecognitionRequest,
-        SFSpeechRecognizerAuthorizationStatusAuthorized,
-        SFSpeechRecognizerAuthorizationStatusDenied,
-        SFSpeechRecognizerAuthorizationStatusRestricted,
-    )
-
-    DISABLE_NATIVE = os.environ.get("ROBOT_ASSISTANT_DISABLE_NATIVE_VOICE") == "1"
-    HAS_MAC_SPEECH = not DISABLE_NATIVE
-except ImportError:  # pragma: no cover - optional dependency fallback
-    HAS_MAC_SPEECH = False
-
-
-@dataclass
+# PyObjC bridges load on first use: the AVFoundation/Speech metadata is slow to
+# import and most processes never touch native voice.
+_MAC_SPEECH: Optional[bool] = None
+
+# Apple caps a buffer recognition task at roughly a minute of audio and latency
+# grows with the buffered length; long sessions are cycled onto a fresh task.
+_MAX_STREAM_SECONDS = 30.0
+
+
+# PyObjC names, bound by _load_mac_speech() once the frameworks import.
+NSSpeechSynthesizer: Any = None
+NSRunLoop: Any = None
+NSDate: Any = None
+NSLocale: Any = None
+AVAudioEngine: Any = None
+AVAudioSession: Any = None
+SFSpeechRecognizer: Any = None
+SFSpeechAudioBufferRecognitionRequest: Any = None
+SFSpeechRecognizerAuthorizationStatusAuthorized: Any = None
+SFSpeechRecognizerAuthorizationStatusDenied: Any = None
+SFSpeechRecognizerAuthorizationStatusRestricted: Any = None
+
+
+def _load_mac_speech() -> bool:
+    """Import the macOS speech frameworks once; return whether native voice is usable."""
+    global _MAC_SPEECH  # noqa: PLW0603 - import-once flag
+    global NSSpeechSynthesizer, NSRunLoop, NSDate, NSLocale  # noqa: PLW0603
+    global AVAudioEngine, AVAudioSession, SFSpeechRecognizer  # noqa: PLW0603
+    global SFSpeechAudioBufferRecognitionRequest  # noqa: PLW0603
+    global SFSpeechRecognizerAuthorizationStatusAuthorized  # noqa: PLW0603
+    global SFSpeechRecognizerAuthorizationStatusDenied  # noqa: PLW0603
+    global SFSpeechRecognizerAuthorizationStatusRestricted  # noqa: PLW0603
+    if _MAC_SPEECH is None:
+        try:  # pragma: no cover - optional macOS dependency
+            import objc  # type: ignore  # noqa: F401
+            from Cocoa import NSSpeechSynthesizer, NSRunLoop, NSDate  # type: ignore
+            from Foundation import NSLocale  # type: ignore
+            from AVFoundation import AVAudioEngine, AVAudioSession  # type: ignore
+            from Speech import (  # type: ignore
+                SFSpeechRecognizer,
+                SFSpeechAudioBufferRecognitionRequest,
+                SFSpeechRecognizerAuthorizationStatusAuthorized,
+                SFSpeechRecognizerAuthorizationStatusDenied,
+                SFSpeechRecognizerAuthorizationStatusRestricted,
+            )
+        except ImportError:  # pragma: no cover - optional dependency fallback
+            _MAC_SPEECH = False
+        else:  # pragma: no cover - macOS specific integration
+            _MAC_SPEECH = os.environ.get("ROBOT_ASSISTANT_DISABLE_NATIVE_VOICE") != "1"
+    return _MAC_SPEECH
+
+
+def __getattr__(name: str) -> Any:
+    # HAS_MAC_SPEECH stays importable but only probes PyObjC when read.
+    if name == "HAS_MAC_SPEECH":
+        return _load_mac_speech()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _spoken_duration(text: str) -> float:
+    """Rough utterance length in seconds; counts separators instead of splitting."""
+    words = text.count(" ") + 1 if text else 0
+    return max(0.2, words * 0.12)
+
+
+@dataclass(slots=True, frozen=True)
 class RecognizedUtterance:
     """Represents a single transcription result."""
 
@@ -55,13 +102,21 @@ class SpeechRecognizer:
     def stop(self) -> None:
         """Release recognizer resources (override in subclasses)."""
 
+    @property
+    def listening(self) -> bool:
+        """True while a recognition stream is active and needs no re-arm."""
+        return False
+
+    def maybe_cycle(self) -> None:
+        """Restart a long-running recognition stream; called on every poll."""
+
     def transcribe_once(self) -> Optional[RecognizedUtterance]:
         """Return one transcription result."""
         if not self._scripted_inputs:
             return None
         text, confidence = self._scripted_inputs.popleft()
         end_ts = perf_counter()
-        start_ts = end_ts - max(0.2, len(text.split()) * 0.12)
+        start_ts = end_ts - _spoken_duration(text)
         return RecognizedUtterance(
             text=text,
             confidence=confidence,
@@ -69,6 +124,22 @@ class SpeechRecognizer:
             end_ts=end_ts,
         )
 
+    def drain(self) -> List[RecognizedUtterance]:
+        """Return every pending transcription at once (replay and batch use)."""
+        scripted = self._scripted_inputs
+        end_ts = perf_counter()
+        utterances = [
+            RecognizedUtterance(
+                text=text,
+                confidence=confidence,
+                start_ts=end_ts - _spoken_duration(text),
+                end_ts=end_ts,
+            )
+            for text, confidence in scripted
+        ]
+        scripted.clear()
+        return utterances
+
     def enqueue_scripted_input(self, text: str, confidence: float = 0.92) -> None:
         """Add a simulated transcription for testing."""
         self._scripted_inputs.append((text, confidence))
@@ -78,12 +149,17 @@ class WakeWordDetector:
     """Wake word listener stub with manual triggers for prototyping."""
 
     def __init__(self, config: VoiceConfig) -> None:
-        self.config = config
         self._triggered: bool = False
+        self.update_config(config)
+
+    def update_config(self, config: VoiceConfig) -> None:
+        """Apply new voice settings; the flags are read once here, not per call."""
+        self.config = config
+        self._use_wake = bool(config.use_wake_word)
 
     def listen(self) -> bool:
         """Return True if the wake word has been detected."""
-        if not self.config.use_wake_word:
+        if not self._use_wake:
             return True
         if self._triggered:
             self._triggered = False
@@ -99,207 +175,250 @@ class SpeechSynthesizer:
     """Delegates text-to-speech playback to the host OS."""
 
     def __init__(self, config: VoiceConfig) -> None:
-        self.config = config
         self._spoken_log: Deque[str] = deque(maxlen=20)
+        # Snapshot handed out by get_spoken_log; cleared whenever the log changes.
+        self._log_snapshot: Optional[Tuple[str, ...]] = None
+        self.update_config(config)
+
+    def update_config(self, config: VoiceConfig) -> None:
+        """Apply new voice settings; the flags are read once here, not per call."""
+        self.config = config
+        self._tts_enabled = bool(config.enable_tts)
 
     def speak(self, text: str) -> None:
         """Play synthesized speech (no-op in prototype)."""
-        if not self.config.enable_tts or not text:
+        if not self._tts_enabled or not text:
             return
-        self._spoken_log.append(text)
+        # Prompts repeat ("OK", "done"); interning keeps one copy per phrase.
+        self._spoken_log.append(sys.intern(text))
+        self._log_snapshot = None
         # In production integrate with NSSpeechSynthesizer or another backend.
 
     def get_spoken_log(self) -> Tuple[str, ...]:
         """Return the latest synthesized snippets."""
-        return tuple(self._spoken_log)
-
-
-if HAS_MAC_SPEECH:  # pragma: no cover - macOS specific integration
-
-    class MacSpeechRecognizer(SpeechRecognizer):
-        """Speech recognizer backed by AVAudioEngine + SFSpeechRecognizer."""
-
-        def __init__(self, config: VoiceConfig) -> None:
-            super().__init__(config)
-            self._queue: "queue.Queue[RecognizedUtterance]" = queue.Queue()
-            self._audio_engine = AVAudioEngine.alloc().init()
-            locale_id = config.transcription_language or "en-US"
-            locale = NSLocale.localeWithLocaleIdentifier_(locale_id)
-            self._recognizer = SFSpeechRecognizer.alloc().initWithLocale_(locale)
-            if self._recognizer is None:
-                raise RuntimeError(f"Unsupported locale for speech recognition: {locale_id}")
-            self._recognition_request = None
-            self._recognition_task = None
-            self._result_handler = None
-            self._running = False
-            self._authorize()
-            self._prepare_audio_session()
-            self._tap_block = None
-
-        def _authorize(self) -> None:
-            status = SFSpeechRecognizer.authorizationStatus()
-            if status == SFSpeechRecognizerAuthorizationStatusAuthorized:
-                return
-            if status in (
-                SFSpeechRecognizerAuthorizationStatusDenied,
-                SFSpeechRecognizerAuthorizationStatusRestricted,
-            ):
-                raise RuntimeError("Speech recognition authorization denied")
+        if self._log_snapshot is None:
+            self._log_snapshot = tuple(self._spoken_log)
+        return self._log_snapshot
 
-            status_holder: "queue.Queue[int]" = queue.Queue()
 
-            def completion(auth_status: int) -> None:
-                status_holder.put(auth_status)
+class MacSpeechRecognizer(SpeechRecognizer):  # pragma: no cover - macOS specific integration
+    """Speech recognizer backed by AVAudioEngine + SFSpeechRecognizer."""
 
-            SFSpeechRecognizer.requestAuthorization_(completion)
-            while status_holder.empty():
-                NSRunLoop.currentRunLoop().runUntilDate_(NSDate.dateWithTimeIntervalSinceNow_(0.1))
-            new_status = status_holder.get()
-            if new_status != SFSpeechRecognizerAuthorizationStatusAuthorized:
-                raise RuntimeError("Speech recognition authorization not granted")
+    def __init__(self, config: VoiceConfig) -> None:
+        if not _load_mac_speech():
+            raise RuntimeError("macOS speech frameworks are unavailable")
+        super().__init__(config)
+        # Single producer (the recognition callback) and no task_done/join use,
+        # so the lock-light SimpleQueue suffices.
+        self._queue: "queue.SimpleQueue[RecognizedUtterance]" = queue.SimpleQueue()
+        self._audio_engine = AVAudioEngine.alloc().init()
+        locale_id = config.transcription_language or "en-US"
+        locale = NSLocale.localeWithLocaleIdentifier_(locale_id)
+        self._recognizer = SFSpeechRecognizer.alloc().initWithLocale_(locale)
+        if self._recognizer is None:
+            raise RuntimeError(f"Unsupported locale for speech recognition: {locale_id}")
+        self._recognition_request = None
+        self._recognition_task = None
+        self._result_handler = None
+        self._running = False
+        self._stream_start_ts = 0.0
+        self._authorize()
+        self._prepare_audio_session()
+        self._tap_block = None
+
+    def _authorize(self) -> None:
+        status = SFSpeechRecognizer.authorizationStatus()
+        if status == SFSpeechRecognizerAuthorizationStatusAuthorized:
+            return
+        if status in (
+            SFSpeechRecognizerAuthorizationStatusDenied,
+            SFSpeechRecognizerAuthorizationStatusRestricted,
+        ):
+            raise RuntimeError("Speech recognition authorization denied")
 
-        def _prepare_audio_session(self) -> None:
-            try:
-                session = AVAudioSession.sharedInstance()
-                # Category and mode strings documented by Apple; ignore errors on macOS if not supported.
-                session.setCategory_error_("AVAudioSessionCategoryPlayAndRecord", None)
-                session.setMode_error_("AVAudioSessionModeDefault", None)
-                session.setActive_error_(True, None)
-            except Exception:
-                pass
+        status_holder: "queue.Queue[int]" = queue.Queue()
 
-        def start(self) -> None:
-            if self._running:
-                return
-            self._recognition_request = SFSpeechAudioBufferRecognitionRequest.alloc().init()
-            self._recognition_request.setShouldReportPartialResults_(True)
-            input_node = self._audio_engine.inputNode()
-            format = input_node.outputFormatForBus_(0)
+        def completion(auth_status: int) -> None:
+            status_holder.put(auth_status)
 
-            def tap_block(buffer, when) -> None:
-                if self._recognition_request is not None:
-                    self._recognition_request.appendAudioPCMBuffer_(buffer)
+        SFSpeechRecognizer.requestAuthorization_(completion)
+        while status_holder.empty():
+            NSRunLoop.currentRunLoop().runUntilDate_(NSDate.dateWithTimeIntervalSinceNow_(0.1))
+        new_status = status_holder.get()
+        if new_status != SFSpeechRecognizerAuthorizationStatusAuthorized:
+            raise RuntimeError("Speech recognition authorization not granted")
 
-            try:
-                input_node.removeTapOnBus_(0)
-            except Exception:
-                pass
+    def _prepare_audio_session(self) -> None:
+        try:
+            session = AVAudioSession.sharedInstance()
+            # Category and mode strings documented by Apple; ignore errors on macOS if not supported.
+            session.setCategory_error_("AVAudioSessionCategoryPlayAndRecord", None)
+            session.setMode_error_("AVAudioSessionModeDefault", None)
+            session.setActive_error_(True, None)
+        except Exception:
+            pass
 
-            input_node.installTapOnBus_bufferSize_format_block_(0, 1024, format, tap_block)
-            self._tap_block = tap_block
-            self._audio_engine.prepare()
-            ok = self._audio_engine.startAndReturnError_(None)
-            if not ok:
-                input_node.removeTapOnBus_(0)
-                raise RuntimeError("Failed to start AVAudioEngine for speech recognition")
-
-            self._result_handler = self._build_result_handler()
-            self._recognition_task = self._recognizer.recognitionTaskWithRequest_resultHandler_(
-                self._recognition_request, self._result_handler
-            )
-            self._running = True
-
-        def _build_result_handler(self):
-            def handler(result, error) -> None:
-                if result is not None:
-                    text = result.bestTranscription().formattedString()
-                    if text:
-                        confidence = self._extract_confidence(result)
-                        timestamp = time.time()
-                        self._queue.put(
-                            RecognizedUtterance(
-                                text=text,
-                                confidence=confidence,
-                                start_ts=timestamp,
-                                end_ts=timestamp,
-                            )
+    def start(self) -> None:
+        if self._running:
+            return
+        self._recognition_request = SFSpeechAudioBufferRecognitionRequest.alloc().init()
+        self._recognition_request.setShouldReportPartialResults_(True)
+        input_node = self._audio_engine.inputNode()
+        format = input_node.outputFormatForBus_(0)
+
+        # Runs on the CoreAudio IO thread for every buffer: bind the append
+        # selector once so each callback is a single bridged call.
+        append_buffer = self._recognition_request.appendAudioPCMBuffer_
+
+        def tap_block(buffer, when) -> None:
+            append_buffer(buffer)
+
+        try:
+            input_node.removeTapOnBus_(0)
+        except Exception:
+            pass
+
+        input_node.installTapOnBus_bufferSize_format_block_(0, 1024, format, tap_block)
+        self._tap_block = tap_block
+        self._audio_engine.prepare()
+        ok = self._audio_engine.startAndReturnError_(None)
+        if not ok:
+            input_node.removeTapOnBus_(0)
+            raise RuntimeError("Failed to start AVAudioEngine for speech recognition")
+
+        self._result_handler = self._build_result_handler()
+        self._recognition_task = self._recognizer.recognitionTaskWithRequest_resultHandler_(
+            self._recognition_request, self._result_handler
+        )
+        self._stream_start_ts = time.monotonic()
+        self._running = True
+
+    def _build_result_handler(self):
+        def handler(result, error) -> None:
+            if result is not None:
+                text = result.bestTranscription().formattedString()
+                if text:
+                    confidence = self._extract_confidence(result)
+                    timestamp = time.time()
+                    self._queue.put(
+                        RecognizedUtterance(
+                            text=text,
+                            confidence=confidence,
+                            start_ts=timestamp,
+                            end_ts=timestamp,
                         )
-                    if result.isFinal():
-                        self._stop_stream()
-                if error is not None:
+                    )
+                if result.isFinal():
                     self._stop_stream()
+            if error is not None:
+                self._stop_stream()
 
-            return handler
+        return handler
 
-        @staticmethod
-        def _extract_confidence(result) -> float:
-            try:
-                segments = result.bestTranscription().segments()
-                if segments and hasattr(segments[-1], "confidence"):
-                    return float(segments[-1].confidence())
-            except Exception:
-                pass
-            return 0.85
+    @staticmethod
+    def _extract_confidence(result) -> float:
+        try:
+            segments = result.bestTranscription().segments()
+            if segments and hasattr(segments[-1], "confidence"):
+                return float(segments[-1].confidence())
+        except Exception:
+            pass
+        return 0.85
 
-        def _stop_stream(self) -> None:
-            if not self._running:
-                return
+    def _stop_stream(self) -> None:
+        if not self._running:
+            return
+        try:
+            input_node = self._audio_engine.inputNode()
+            input_node.removeTapOnBus_(0)
+        except Exception:
+            pass
+        try:
+            self._audio_engine.stop()
+        except Exception:
+            pass
+        if self._recognition_request is not None:
             try:
-                input_node = self._audio_engine.inputNode()
-                input_node.removeTapOnBus_(0)
+                self._recognition_request.endAudio()
             except Exception:
                 pass
+        if self._recognition_task is not None:
             try:
-                self._audio_engine.stop()
+                self._recognition_task.cancel()
             except Exception:
                 pass
-            if self._recognition_request is not None:
-                try:
-                    self._recognition_request.endAudio()
-                except Exception:
-                    pass
-            if self._recognition_task is not None:
-                try:
-                    self._recognition_task.cancel()
-                except Exception:
-                    pass
-            self._recognition_task = None
-            self._recognition_request = None
-            self._tap_block = None
-            self._running = False
-
-        def stop(self) -> None:
+        self._recognition_task = None
+        self._recognition_request = None
+        self._tap_block = None
+        self._running = False
+
+    def stop(self) -> None:
+        self._stop_stream()
+
+    @property
+    def listening(self) -> bool:
+        return self._running
+
+    def maybe_cycle(self) -> None:
+        # Runs on the polling thread rather than in the tap block: tearing down
+        # the tap from inside its own CoreAudio callback is unsafe.
+        if self._running and time.monotonic() - self._stream_start_ts > _MAX_STREAM_SECONDS:
             self._stop_stream()
+            self.start()
 
-        def transcribe_once(self) -> Optional[RecognizedUtterance]:
-            if not self._queue.empty():
-                return self._queue.get()
+    def transcribe_once(self) -> Optional[RecognizedUtterance]:
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
             return super().transcribe_once()
 
-    class MacSpeechSynthesizer(SpeechSynthesizer):
-        """NSSpeechSynthesizer-backed TTS."""
+    def drain(self) -> List[RecognizedUtterance]:
+        utterances: List[RecognizedUtterance] = []
+        while True:
+            try:
+                utterances.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        utterances.extend(super().drain())
+        return utterances
 
-        def __init__(self, config: VoiceConfig) -> None:
-            super().__init__(config)
-            self._synth = None
 
-        def _ensure_synth(self):
-            if self._synth is not None:
-                return
-            voice = self.config.tts_voice or None
-            try:
-                if voice:
-                    self._synth = NSSpeechSynthesizer.alloc().initWithVoice_(voice)
-                if self._synth is None:
-                    self._synth = NSSpeechSynthesizer.alloc().init()
-            except Exception:
-                self._synth = None
-
-        def speak(self, text: str) -> None:
-            if not text:
-                return
-            super().speak(text)
-            if not self.config.enable_tts:
-                return
-            self._ensure_synth()
+class MacSpeechSynthesizer(SpeechSynthesizer):  # pragma: no cover - macOS specific integration
+    """NSSpeechSynthesizer-backed TTS."""
+
+    def __init__(self, config: VoiceConfig) -> None:
+        if not _load_mac_speech():
+            raise RuntimeError("macOS speech frameworks are unavailable")
+        super().__init__(config)
+        self._synth = None
+
+    def _ensure_synth(self):
+        if self._synth is not None:
+            return
+        voice = self.config.tts_voice or None
+        try:
+            if voice:
+                self._synth = NSSpeechSynthesizer.alloc().initWithVoice_(voice)
             if self._synth is None:
-                return
-            try:
-                if self._synth.isSpeaking():
-                    self._synth.stopSpeaking()
-                self._synth.startSpeakingString_(text)
-            except Exception:
-                pass
+                self._synth = NSSpeechSynthesizer.alloc().init()
+        except Exception:
+            self._synth = None
+
+    def speak(self, text: str) -> None:
+        if not text:
+            return
+        super().speak(text)
+        if not self._tts_enabled:
+            return
+        self._ensure_synth()
+        if self._synth is None:
+            return
+        try:
+            if self._synth.isSpeaking():
+                self._synth.stopSpeaking()
+            self._synth.startSpeakingString_(text)
+        except Exception:
+            pass
 
 
 class VoiceOrchestrator:
@@ -314,43 +433,88 @@ class VoiceOrchestrator:
     ) -> None:
         self.config = config
         voice_cfg = config.voice
-        if recognizer is None and HAS_MAC_SPEECH:
+        if recognizer is None and _load_mac_speech():
             try:
                 recognizer = MacSpeechRecognizer(voice_cfg)  # type: ignore[arg-type]
             except Exception:
                 recognizer = None
         self.recognizer = recognizer or SpeechRecognizer(voice_cfg)
         self.wake_detector = wake_detector or WakeWordDetector(voice_cfg)
-        if synthesizer is None and HAS_MAC_SPEECH:
+        if synthesizer is None and _load_mac_speech():
             try:
                 synthesizer = MacSpeechSynthesizer(voice_cfg)  # type: ignore[arg-type]
             except Exception:
                 synthesizer = None
         self.synthesizer = synthesizer or SpeechSynthesizer(voice_cfg)
         self._last_utterance: Optional[RecognizedUtterance] = None
+        # Without a wake word every poll is gated open, so skip the detector call.
+        self._wake_bypass = not voice_cfg.use_wake_word
+        # Native recognizers push results onto a queue from their callback
+        # thread; polling reads it directly instead of going through the facade.
+        self._result_queue: Optional["queue.SimpleQueue[RecognizedUtterance]"] = getattr(
+            self.recognizer, "_queue", None
+        )
         self.recognizer.start()
 
     def poll_intent(self) -> Optional[Dict[str, Any]]:
         """Return a runtime intent derived from speech input."""
-        if not self.wake_detector.listen():
+        # Before the wake gate and the queue read: the stream keeps buffering
+        # audio either way, and steady partial results must not defer the cap.
+        self.recognizer.maybe_cycle()
+        if not self._wake_bypass and not self.wake_detector.listen():
             return None
-        utterance = self.recognizer.transcribe_once()
+        utterance: Optional[RecognizedUtterance] = None
+        if self._result_queue is not None:
+            try:
+                utterance = self._result_queue.get_nowait()
+            except queue.Empty:
+                pass
+        if utterance is None:
+            utterance = self.recognizer.transcribe_once()
         if not utterance:
             return None
         self._last_utterance = utterance
-        intent = {
+        intent = self._intent_for(utterance)
+        # Re-arm the recognizer only once its stream has actually ended;
+        # partial results arrive while the current task is still running.
+        if not self.recognizer.listening:
+            try:
+                self.recognizer.start()
+            except Exception:
+                pass
+        return intent
+
+    def drain_intents(self) -> List[Dict[str, Any]]:
+        """Return intents for every pending utterance in one call.
+
+        The wake gate is checked once for the whole batch, and the recognizer
+        is not re-armed; this is meant for replaying scripted sessions.
+        """
+        self.recognizer.maybe_cycle()
+        if not self._wake_bypass and not self.wake_detector.listen():
+            return []
+        utterances = self.recognizer.drain()
+        if utterances:
+            self._last_utterance = utterances[-1]
+        intent_for = self._intent_for
+        return [intent_for(utterance) for utterance in utterances]
+
+    @staticmethod
+    def _intent_for(utterance: RecognizedUtterance) -> Dict[str, Any]:
+        return {
             "skill": "assistant",
             "query": utterance.text,
             "confidence": utterance.confidence,
             "source": "voice",
             "timestamps": {"start": utterance.start_ts, "end": utterance.end_ts},
         }
-        # Re-arm recognizer for the next utterance.
-        try:
-            self.recognizer.start()
-        except Exception:
-            pass
-        return intent
+
+    def update_config(self, voice_cfg: VoiceConfig) -> None:
+        """Apply new voice settings to the wake gate and synthesizer."""
+        self.config.voice = voice_cfg
+        self._wake_bypass = not voice_cfg.use_wake_word
+        self.wake_detector.update_config(voice_cfg)
+        self.synthesizer.update_config(voice_cfg)
 
     def enqueue_transcript(self, text: str, confidence: float = 0.92) -> None:
         """Add scripted voice input and trigger wake detection."""
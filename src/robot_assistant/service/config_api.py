@@ -2,36 +2,45 @@
 
 from __future__ import annotations
 
-import copy
+import asyncio
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import Body, Depends, FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
-from robot_assistant.config.defaults import RuntimeConfig
+try:  # pragma: no cover - optional faster serializer
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+from robot_assistant.config.defaults import RuntimeConfig, ToolingConfig
 from robot_assistant.config.runtime_store import (
     CONFIG_PATH,
     load_runtime_config,
     runtime_config_from_dict,
     runtime_config_to_dict,
-    save_runtime_config,
+    save_runtime_config_dict,
 )
 from robot_assistant.runtime.memory import ConversationMemory
 
 
-def _default_cors_origins() -> list[str]:
-    return ["http://localhost:5173", "http://127.0.0.1:5173"]
+def _default_cors_origins() -> frozenset[str]:
+    return frozenset({"http://localhost:5173", "http://127.0.0.1:5173"})
 
 
 app = FastAPI(title="Robot Assistant Config Service", version="0.1.0")
 
 cors_origins = os.environ.get("ROBOT_ASSISTANT_CONFIG_CORS")
+# CORSMiddleware checks ``origin in allow_origins`` per request; a frozenset
+# makes that a hash probe instead of a list scan.
 origins = (
-    [origin.strip() for origin in cors_origins.split(",") if origin.strip()]
+    frozenset(origin for origin in map(str.strip, cors_origins.split(",")) if origin)
     if cors_origins
     else _default_cors_origins()
 )
@@ -45,7 +54,26 @@ app.add_middleware(
 )
 
 CONFIG_TOKEN = os.environ.get("ROBOT_ASSISTANT_CONFIG_TOKEN")
-_CONFIG_CACHE: RuntimeConfig = load_runtime_config()
+# Single-slot holder for (config, serialized view). Replacing the slot swaps
+# both at once, so a reader never pairs a config with another config's dict.
+_initial_config = load_runtime_config()
+_CONFIG: List[Tuple[RuntimeConfig, Dict[str, Any]]] = [
+    (_initial_config, runtime_config_to_dict(_initial_config))
+]
+# Template for full replacements; runtime_config_from_dict copies containers
+# out of its base and never mutates it, so one instance can be shared.
+_DEFAULT_RUNTIME_CONFIG: RuntimeConfig = RuntimeConfig()
+# Consent metadata keyed by the ToolingConfig it was built from; every config
+# replacement installs a new ToolingConfig, which invalidates the entry.
+_TOOLING_CACHE: List[Optional[Tuple[ToolingConfig, Dict[str, Any]]]] = [None]
+# Serializes disk writes made from worker threads.
+_SAVE_LOCK = threading.Lock()
+# Serialized dict most recently written; lets queued saves that a newer write
+# already covered return without touching the disk.
+_SAVED: List[Optional[Dict[str, Any]]] = [None]
+# Shared by the preference endpoints; opened on first use and reopened only
+# when the memory section of the config changes.
+_MEMORY: Optional[ConversationMemory] = None
 
 
 async def verify_token(x_api_token: Optional[str] = Header(default=None)) -> None:
@@ -54,14 +82,74 @@ async def verify_token(x_api_token: Optional[str] = Header(default=None)) -> Non
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid api token")
 
 
+def _tail_lines(path: Path, limit: int, block_size: int = 65536) -> list[str]:
+    """Return the last ``limit`` lines of ``path``, reading backwards from EOF."""
+    with path.open("rb") as handle:
+        position = handle.seek(0, os.SEEK_END)
+        buffer = b""
+        # limit + 1 newlines guarantee the oldest kept line is complete.
+        while position > 0 and buffer.count(b"\n") <= limit:
+            step = min(block_size, position)
+            position -= step
+            handle.seek(position)
+            buffer = handle.read(step) + buffer
+    return buffer.decode("utf-8", errors="replace").splitlines()[-limit:]
+
+
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Encode an already JSON-ready payload, bypassing FastAPI's encoder pass."""
+    if orjson is not None:
+        return Response(orjson.dumps(payload), media_type="application/json")
+    return JSONResponse(payload)
+
+
 def _get_config() -> RuntimeConfig:
-    return _CONFIG_CACHE
+    return _CONFIG[0][0]
+
+
+def _get_config_dict() -> Dict[str, Any]:
+    return _CONFIG[0][1]
+
+
+def _get_memory() -> ConversationMemory:
+    global _MEMORY  # noqa: PLW0603 - module level cache
+    if _MEMORY is None:
+        _MEMORY = ConversationMemory(_get_config().memory)
+    return _MEMORY
+
+
+def _close_memory() -> None:
+    global _MEMORY  # noqa: PLW0603 - module level cache
+    if _MEMORY is not None:
+        _MEMORY.close()
+        _MEMORY = None
 
 
 def _set_config(config: RuntimeConfig) -> None:
-    global _CONFIG_CACHE  # noqa: PLW0603 - module level cache
-    _CONFIG_CACHE = config
-    save_runtime_config(config, CONFIG_PATH)
+    if config.memory != _get_config().memory:
+        _close_memory()
+    _CONFIG[0] = (config, runtime_config_to_dict(config))
+
+
+def _persist_config() -> None:
+    # Writes whatever is current when the lock is acquired, so overlapping
+    # requests cannot leave an older config on disk than the one in memory.
+    with _SAVE_LOCK:
+        payload = _get_config_dict()
+        if payload is _SAVED[0]:
+            return
+        save_runtime_config_dict(payload, CONFIG_PATH)
+        _SAVED[0] = payload
+
+
+async def _store_config(config: RuntimeConfig) -> None:
+    _set_config(config)
+    await asyncio.to_thread(_persist_config)
+
+
+@app.on_event("shutdown")
+async def shutdown_memory() -> None:
+    _close_memory()
 
 
 @app.get("/health", dependencies=[Depends(verify_token)])
@@ -72,25 +160,24 @@ async def health() -> Dict[str, str]:
 @app.get("/config", dependencies=[Depends(verify_token)])
 async def get_config() -> Dict[str, Any]:
     """Return the complete runtime configuration."""
-    return runtime_config_to_dict(_get_config())
+    return _get_config_dict()
 
 
 @app.put("/config", dependencies=[Depends(verify_token)])
 async def replace_config(payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """Replace the entire runtime configuration."""
     try:
-        new_config = runtime_config_from_dict(payload, RuntimeConfig())
+        new_config = runtime_config_from_dict(payload, _DEFAULT_RUNTIME_CONFIG)
     except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
-    _set_config(new_config)
-    return runtime_config_to_dict(new_config)
+    await _store_config(new_config)
+    return _get_config_dict()
 
 
 @app.patch("/config/{section}", dependencies=[Depends(verify_token)])
 async def patch_section(section: str, payload: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """Patch a specific configuration section (models, tooling, voice, safety, memory, retrieval)."""
-    config = _get_config()
-    config_dict = runtime_config_to_dict(config)
+    config_dict = _get_config_dict()
     if section not in config_dict:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="unknown section")
     section_data = config_dict[section]
@@ -99,25 +186,22 @@ async def patch_section(section: str, payload: Dict[str, Any] = Body(...)) -> Di
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="section is not patchable via dict merge",
         )
-    updated = copy.deepcopy(config_dict)
-    updated_section = updated[section]
-    updated_section.update(payload)
+    # Only the patched section is copied; the other sections are read, never
+    # mutated, while the dataclasses are rebuilt.
+    updated = dict(config_dict)
+    updated[section] = {**section_data, **payload}
     try:
-        new_config = runtime_config_from_dict(updated, RuntimeConfig())
+        new_config = runtime_config_from_dict(updated, _DEFAULT_RUNTIME_CONFIG)
     except (TypeError, ValueError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
-    _set_config(new_config)
-    return runtime_config_to_dict(new_config)[section]
+    await _store_config(new_config)
+    return _get_config_dict()[section]
 
 
 @app.get("/sessions/{session_id}/preferences", dependencies=[Depends(verify_token)])
 async def get_preferences(session_id: str) -> Dict[str, Any]:
     """Return stored preferences for a session."""
-    memory = ConversationMemory(_get_config().memory)
-    try:
-        prefs = memory.get_preferences(session_id)
-    finally:
-        memory.close()
+    prefs = _get_memory().get_preferences(session_id)
     return {"session_id": session_id, "preferences": prefs}
 
 
@@ -128,36 +212,33 @@ class PreferenceUpdate(BaseModel):
 @app.put("/sessions/{session_id}/preferences/{key}", dependencies=[Depends(verify_token)])
 async def set_preference(session_id: str, key: str, update: PreferenceUpdate) -> Dict[str, Any]:
     """Persist a preference value for the given session."""
-    memory = ConversationMemory(_get_config().memory)
-    try:
-        memory.set_preference(session_id, key, update.value)
-        prefs = memory.get_preferences(session_id)
-    finally:
-        memory.close()
+    memory = _get_memory()
+    memory.set_preference(session_id, key, update.value)
+    prefs = memory.get_preferences(session_id)
     return {"session_id": session_id, "preferences": prefs}
 
 
 @app.get("/safety/log", dependencies=[Depends(verify_token)])
-async def get_safety_log(limit: int = 200) -> Dict[str, Any]:
+async def get_safety_log(limit: int = 200) -> Response:
     """Return recent entries from the safety audit log."""
     path = Path(_get_config().safety.audit_log_path)
     if not path.exists():
-        return {"entries": []}
-    lines = path.read_text(encoding="utf-8").splitlines()
-    tail = lines[-limit:] if limit > 0 else lines
+        return _json_response({"entries": []})
+    if limit > 0:
+        tail = _tail_lines(path, limit)
+    else:
+        tail = path.read_text(encoding="utf-8").splitlines()
+    loads = orjson.loads if orjson is not None else json.loads
     entries = []
     for line in tail:
         try:
-            entries.append(json.loads(line))
-        except json.JSONDecodeError:
+            entries.append(loads(line))
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
             entries.append({"raw": line, "error": "invalid json"})
-    return {"entries": entries}
+    return _json_response({"entries": entries})
 
 
-@app.get("/tooling/consent", dependencies=[Depends(verify_token)])
-async def get_tooling_metadata() -> Dict[str, Any]:
-    """Describe tooling configuration with consent requirements."""
-    tooling = _get_config().tooling
+def _build_tooling_metadata(tooling: ToolingConfig) -> Dict[str, Any]:
     consent_matrix = [
         {"tool": "search_docs", "requires_consent": False, "enabled": True},
         {"tool": "get_runtime_state", "requires_consent": False, "enabled": True},
@@ -191,3 +272,13 @@ async def get_tooling_metadata() -> Dict[str, Any]:
         "file_search_roots": tooling.file_search_roots,
         "consent_matrix": consent_matrix,
     }
+
+
+@app.get("/tooling/consent", dependencies=[Depends(verify_token)])
+async def get_tooling_metadata() -> Dict[str, Any]:
+    """Describe tooling configuration with consent requirements."""
+    tooling = _get_config().tooling
+    cached = _TOOLING_CACHE[0]
+    if cached is None or cached[0] is not tooling:
+        cached = _TOOLING_CACHE[0] = (tooling, _build_tooling_metadata(tooling))
+    return cached[1]
@@ -1,13 +1,20 @@
 """Skill registry managing task-oriented behaviors."""
 
-from typing import Any, Dict, Callable
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from robot_assistant.planning.planner import Planner
 from robot_assistant.control.controller import Controller
 
 
+# Intents and state stay plain dicts: voice intents, the assistant pipeline and
+# planner output all exchange them, and routing reads a single key per call.
 SkillHandler = Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
 
+_SKILL_KEY = sys.intern("skill")
+_DEFAULT = "default"
+
 
 class SkillRegistry:
     """Registers and dispatches skills based on incoming intents."""
@@ -15,17 +22,90 @@ class SkillRegistry:
     def __init__(self, planner: Planner, controller: Controller) -> None:
         self.planner = planner
         self.controller = controller
-        self._skills: Dict[str, SkillHandler] = {"default": self._default_skill}
+        # Bound once so dispatch does not build a bound method per fallback.
+        self._fallback: SkillHandler = self._default_skill
+        # Handler registered as "default"; most intents carry no skill key and
+        # go straight here without probing _skills.
+        self._default: SkillHandler = self._fallback
+        self._skills: Dict[str, SkillHandler] = {_DEFAULT: self._fallback}
+        self._frozen = False
+        # Until a skill is registered every intent lands on the planner, so
+        # dispatch skips the routing entirely. Bind ``dispatch`` only after
+        # registering skills; register() restores the routing method.
+        self.dispatch = self._dispatch_trivial  # type: ignore[method-assign]
 
     def register(self, name: str, handler: SkillHandler) -> None:
         """Add a new skill handler."""
+        if self._frozen:
+            raise RuntimeError("skill registry is frozen")
         self._skills[name] = handler
+        self.__dict__.pop("dispatch", None)
+        if name == _DEFAULT:
+            self._default = handler
+
+    def register_default(self, name: str, handler: SkillHandler) -> SkillHandler:
+        """Register ``handler`` only if ``name`` is free; return the handler in effect.
+
+        A single ``setdefault`` replaces the check-then-register pattern, so
+        there is no window for another thread to register in between.
+        """
+        if self._frozen:
+            raise RuntimeError("skill registry is frozen")
+        self.__dict__.pop("dispatch", None)
+        return self._skills.setdefault(name, handler)
+
+    def freeze(self) -> None:
+        """Stop accepting registrations once the skill set is final.
+
+        Names are interned and the table rebuilt compactly, so intents that
+        carry literal (interned) skill names hit the dict identity fast path.
+        """
+        self._skills = {sys.intern(name): handler for name, handler in self._skills.items()}
+        self._skills_view = MappingProxyType(self._skills)
+        self._frozen = True
+
+    @property
+    def skills(self) -> Mapping[str, SkillHandler]:
+        """Read-only view of the registered handlers.
+
+        Once frozen the same view is returned every time, so callers can hold
+        on to it without copying.
+        """
+        if self._frozen:
+            return self._skills_view
+        return MappingProxyType(self._skills)
 
     def dispatch(self, intents: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """Select an appropriate skill to handle intents."""
-        skill_name = intents.get("skill", "default")
-        handler = self._skills.get(skill_name, self._default_skill)
-        return handler(intents, state)
+        name = intents.get(_SKILL_KEY)
+        if name is None or name == _DEFAULT:
+            return self._default(intents, state)
+        return self._skills.get(name, self._fallback)(intents, state)
+
+    def dispatch_many(
+        self, intents_list: Iterable[Dict[str, Any]], state: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Dispatch a batch of intents against one state, preserving order.
+
+        Each distinct skill name is resolved to its handler once per batch.
+        """
+        resolved: Dict[Optional[str], SkillHandler] = {}
+        results: List[Dict[str, Any]] = []
+        for intents in intents_list:
+            name = intents.get(_SKILL_KEY)
+            handler = resolved.get(name)
+            if handler is None:
+                handler = resolved[name] = self._resolve(name)
+            results.append(handler(intents, state))
+        return results
+
+    def _resolve(self, name: Optional[str]) -> SkillHandler:
+        if name is None or name == _DEFAULT:
+            return self._default
+        return self._skills.get(name, self._fallback)
+
+    def _dispatch_trivial(self, intents: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        return self.planner.build_plan(intents, state)
 
     def _default_skill(self, intents: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback behavior when no specialized skill matches."""
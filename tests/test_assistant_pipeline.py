@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from robot_assistant.config.defaults import RuntimeConfig
+from robot_assistant.runtime.ai import AssistantPipeline
+from robot_assistant.runtime.ai.retrieval import Document
+
+
+def _pipeline(tmp_path: Path) -> AssistantPipeline:
+    config = RuntimeConfig()
+    config.safety.audit_log_path = str(tmp_path / "safety.log")
+    pipeline = AssistantPipeline(config)
+    pipeline.ingest_documents(
+        [
+            Document(doc_id="voice", content="Wake word detection and speech synthesis."),
+            Document(doc_id="memory", content="SQLite conversation memory keeps recent turns."),
+        ]
+    )
+    return pipeline
+
+
+def _drain(stream):
+    chunks = []
+    while True:
+        try:
+            chunks.append(next(stream))
+        except StopIteration as stop:
+            return chunks, stop.value
+
+
+def test_stream_handle_matches_handle(tmp_path: Path) -> None:
+    pipeline = _pipeline(tmp_path)
+    intents = {"skill": "assistant", "query": "How is conversation memory stored?"}
+
+    expected = pipeline.handle(intents, {})
+    chunks, plan = _drain(pipeline.stream_handle(intents, {}))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == expected["response"]
+    assert plan["response"] == expected["response"]
+    assert plan["metadata"]["model"] == expected["metadata"]["model"]
+    assert "generation" in plan["metadata"]["latency_ms"]
+
+
+def test_stream_generation_latency_excludes_consumer_time(tmp_path: Path) -> None:
+    pipeline = _pipeline(tmp_path)
+    stream = pipeline.stream_handle({"skill": "assistant", "query": "How is memory stored?"}, {})
+    paused_ms = 0.0
+    try:
+        for _ in range(5):
+            next(stream)
+            time.sleep(0.02)
+            paused_ms += 20.0
+        while True:
+            next(stream)
+    except StopIteration as stop:
+        plan = stop.value
+
+    assert plan["metadata"]["latency_ms"]["generation"] < paused_ms
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from robot_assistant.config.defaults import MemoryConfig
+from robot_assistant.runtime.memory.store import ConversationMemory
+
+
+def test_write_behind_persists_after_flush(tmp_path):
+    db_path = tmp_path / "memory.db"
+    memory = ConversationMemory(MemoryConfig(db_path=str(db_path), write_behind=True))
+    for index in range(40):
+        memory.append_turn("s1", "user", f"turn {index}")
+    memory.set_preference("s1", "tone", "calm")
+    memory.flush()
+
+    turns = memory.get_recent_turns("s1", limit=3)
+    assert [turn["content"] for turn in turns] == ["turn 37", "turn 38", "turn 39"]
+    assert memory.get_preferences("s1") == {"tone": "calm"}
+
+    memory.append_turn("s1", "assistant", "last")
+    memory.close()
+
+    reopened = ConversationMemory(MemoryConfig(db_path=str(db_path)))
+    assert reopened.get_recent_turns("s1", limit=1)[0]["content"] == "last"
+    reopened.close()
+
+
+def test_recent_turns_projects_requested_fields(tmp_path):
+    memory = ConversationMemory(MemoryConfig(db_path=str(tmp_path / "memory.db")))
+    memory.append_turn("s1", "user", "hello", {"source": "voice"})
+
+    assert memory.get_recent_turns("s1", fields=("role", "content")) == [{"role": "user", "content": "hello"}]
+    assert memory.get_recent_turns("s1")[0]["metadata"] == {"source": "voice"}
+    memory.close()
+
+
+def test_turn_indices_continue_after_reopen(tmp_path):
+    config = MemoryConfig(db_path=str(tmp_path / "memory.db"))
+    memory = ConversationMemory(config)
+    memory.append_turn("s1", "user", "first")
+    memory.append_turn("s2", "user", "other session")
+    memory.close()
+
+    memory = ConversationMemory(config)
+    memory.append_turn("s1", "assistant", "second")
+    assert [turn["content"] for turn in memory.get_recent_turns("s1")] == ["first", "second"]
+    memory.close()
+
+
+def test_transaction_commits_or_rolls_back_as_a_unit(tmp_path):
+    config = MemoryConfig(db_path=str(tmp_path / "memory.db"))
+    memory = ConversationMemory(config)
+    with memory.transaction():
+        memory.append_turn("s1", "user", "kept")
+        memory.set_preference("s1", "tone", "calm")
+    try:
+        with memory.transaction():
+            memory.append_turn("s1", "user", "dropped")
+            raise RuntimeError("abort turn")
+    except RuntimeError:
+        pass
+    memory.close()
+
+    reopened = ConversationMemory(config)
+    assert [turn["content"] for turn in reopened.get_recent_turns("s1")] == ["kept"]
+    assert reopened.get_preferences("s1") == {"tone": "calm"}
+    reopened.close()
+
+
+def test_recent_window_serves_queued_turns_before_flush(tmp_path):
+    config = MemoryConfig(db_path=str(tmp_path / "memory.db"), history_window=4, write_behind=True)
+    memory = ConversationMemory(config)
+    for index in range(6):
+        memory.append_turn("s1", "user", f"turn {index}", {"n": str(index)})
+
+    turns = memory.get_recent_turns("s1", limit=2)
+    assert [(turn["content"], turn["metadata"]) for turn in turns] == [
+        ("turn 4", {"n": "4"}),
+        ("turn 5", {"n": "5"}),
+    ]
+    memory.flush()
+    assert len(memory.get_recent_turns("s1", limit=10)) == 6
+    memory.close()
+
+
+def test_write_behind_deep_reads_see_queued_turns(tmp_path):
+    config = MemoryConfig(db_path=str(tmp_path / "memory.db"), history_window=2, write_behind=True)
+    memory = ConversationMemory(config)
+    for index in range(5):
+        memory.append_turn("s", "user", f"turn {index}")
+
+    assert [turn["content"] for turn in memory.get_recent_turns("s", 10)] == [
+        f"turn {index}" for index in range(5)
+    ]
+    memory.close()
+
+
+def test_write_behind_failure_is_raised_and_writer_survives(tmp_path):
+    memory = ConversationMemory(MemoryConfig(db_path=str(tmp_path / "memory.db"), write_behind=True))
+
+    def broken(conn, record):
+        raise ValueError("boom")
+
+    memory._write(broken, ())
+    with pytest.raises(RuntimeError):
+        memory.flush()
+
+    memory.append_turn("s", "user", "after failure")
+    memory.flush()
+    assert memory.get_recent_turns("s", 10)[0]["content"] == "after failure"
+    memory.close()
+
+
+def test_write_behind_failed_turn_leaves_the_window(tmp_path):
+    memory = ConversationMemory(MemoryConfig(db_path=str(tmp_path / "memory.db"), write_behind=True))
+    memory.append_turn("s", "user", "t0")
+    memory.flush()
+
+    def broken(conn, record):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    memory._insert_turn = broken
+    memory.append_turn("s", "user", "lost")
+    del memory._insert_turn
+    with pytest.raises(RuntimeError):
+        memory.flush()
+    assert [turn["content"] for turn in memory.get_recent_turns("s", 2)] == ["t0"]
+
+    memory.append_turn("s", "assistant", "t1")
+    memory.flush()
+    assert [turn["content"] for turn in memory.get_recent_turns("s", 2)] == ["t0", "t1"]
+    assert [turn["content"] for turn in memory.get_recent_turns("s", 50)] == ["t0", "t1"]
+    memory.close()
+
+
+def test_write_behind_failure_drops_only_the_failing_write(tmp_path):
+    memory = ConversationMemory(MemoryConfig(db_path=str(tmp_path / "memory.db"), write_behind=True))
+    release = threading.Event()
+
+    def blocked(conn, record):
+        release.wait()
+
+    def broken(conn, record):
+        raise ValueError("boom")
+
+    # Hold the writer so the next three writes are committed as one batch.
+    memory._write(blocked, ())
+    memory.append_turn("s1", "user", "kept")
+    memory._write(broken, ())
+    memory.set_preference("s2", "tone", "calm")
+    release.set()
+    with pytest.raises(RuntimeError):
+        memory.flush()
+
+    assert [turn["content"] for turn in memory.get_recent_turns("s1", 50)] == ["kept"]
+    assert memory.get_preferences("s2") == {"tone": "calm"}
+    memory.close()
+
+
+def test_write_behind_transaction_discards_writes_on_error(tmp_path):
+    config = MemoryConfig(db_path=str(tmp_path / "memory.db"), write_behind=True)
+    memory = ConversationMemory(config)
+    with pytest.raises(RuntimeError):
+        with memory.transaction():
+            memory.append_turn("s1", "user", "dropped")
+            memory.set_preference("s1", "tone", "curt")
+            raise RuntimeError("abort turn")
+    with memory.transaction():
+        memory.append_turn("s1", "user", "kept")
+
+    assert [turn["content"] for turn in memory.get_recent_turns("s1")] == ["kept"]
+    memory.close()
+
+    reopened = ConversationMemory(config)
+    assert [turn["content"] for turn in reopened.get_recent_turns("s1")] == ["kept"]
+    assert reopened.get_preferences("s1") == {}
+    reopened.close()
+
+
+@pytest.mark.parametrize("write_behind", [False, True])
+def test_two_instances_on_one_database_keep_every_turn(tmp_path, write_behind):
+    config = MemoryConfig(db_path=str(tmp_path / "memory.db"), write_behind=write_behind)
+    first = ConversationMemory(config)
+    second = ConversationMemory(config)
+
+    first.append_turn("s", "user", "a1")
+    first.flush()
+    second.append_turn("s", "user", "b1")
+    second.flush()
+    first.append_turn("s", "user", "a2")
+    first.append_turn("s", "user", "a3")
+    first.flush()
+
+    assert [turn["content"] for turn in first.get_recent_turns("s")] == ["a1", "b1", "a2", "a3"]
+    first.close()
+    second.close()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from robot_assistant.config.defaults import RetrievalConfig
+from robot_assistant.runtime.ai.retrieval import (
+    Document,
+    EmbeddingProvider,
+    InMemoryVectorStore,
+    KnowledgeRetriever,
+)
+
+DOCS = [
+    Document(doc_id="voice", content="Wake word detection and speech synthesis."),
+    Document(doc_id="memory", content="SQLite conversation memory keeps recent turns."),
+    Document(doc_id="safety", content="Safety manager pauses tools and writes an audit log."),
+]
+
+
+def test_similarity_search_ranks_and_replaces_documents():
+    store = InMemoryVectorStore(EmbeddingProvider())
+    store.add_documents(
+        [
+            Document(doc_id="voice", content="wake word speech synthesis"),
+            Document(doc_id="memory", content="sqlite conversation memory"),
+            Document(doc_id="safety", content="pause resume audit log"),
+        ]
+    )
+    store.add_documents([Document(doc_id="voice", content="speaker diarization")])
+
+    results = store.similarity_search("sqlite conversation memory", top_k=5)
+
+    assert [doc.doc_id for doc, _ in results][0] == "memory"
+    assert len(results) == 3
+    assert abs(results[0][1] - 1.0) < 1e-5
+    assert store.similarity_search("speaker diarization", top_k=1)[0][0].doc_id == "voice"
+
+
+def test_rrf_fusion_ranks_documents_found_by_both_lists_first():
+    for fusion in ("rrf", "weighted"):
+        retriever = KnowledgeRetriever(
+            InMemoryVectorStore(EmbeddingProvider()), RetrievalConfig(fusion=fusion)
+        )
+        retriever.ingest(DOCS)
+
+        results = retriever.retrieve("how does conversation memory work?")
+
+        assert results[0].document.doc_id == "memory"
+        assert results[0].components["lexical"] > 0
+        assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+
+
+def test_persisted_index_skips_unchanged_documents(tmp_path):
+    pytest.importorskip("numpy")
+    embedded = []
+
+    class CountingEmbedder(EmbeddingProvider):
+        def embed_batch(self, texts):
+            embedded.extend(texts)
+            return super().embed_batch(texts)
+
+    InMemoryVectorStore(CountingEmbedder(), persist_path=tmp_path / "index").add_documents(DOCS)
+    embedded.clear()
+
+    changed = [DOCS[0], Document(doc_id="memory", content="Preferences persist per session."), DOCS[2]]
+    store = InMemoryVectorStore(CountingEmbedder(), persist_path=tmp_path / "index")
+    store.add_documents(changed)
+
+    assert embedded == ["Preferences persist per session."]
+    assert store.similarity_search("wake word speech", top_k=1)[0][0].doc_id == "voice"
@@ -9,6 +9,8 @@ from robot_assistant.config.runtime_store import (
     runtime_config_from_dict,
     runtime_config_to_dict,
     save_runtime_config,
+    save_runtime_config_diff,
+    save_runtime_config_dict,
 )
 
 
@@ -62,3 +64,73 @@ def test_save_writes_json(tmp_path: Path) -> None:
     parsed = json.loads(target.read_text())
     assert isinstance(parsed, dict)
     assert parsed["memory"]["history_window"] == config.memory.history_window
+
+
+def test_load_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    target = tmp_path / "runtime_config.json"
+    config = RuntimeConfig()
+    config.tooling.shell_allowlist = ["pwd"]
+    save_runtime_config(config, target)
+
+    first = load_runtime_config(target)
+    first.tooling.shell_allowlist.append("rm")
+    second = load_runtime_config(target)
+    assert second.tooling.shell_allowlist == ["pwd"]
+
+    config.loop_rate_hz = 42.0
+    save_runtime_config(config, target)
+    assert load_runtime_config(target).loop_rate_hz == 42.0
+
+
+def test_save_serialized_dict_matches_config_save(tmp_path: Path) -> None:
+    config = RuntimeConfig()
+    config.voice.enable_tts = False
+    target = tmp_path / "runtime_config.json"
+
+    save_runtime_config_dict(runtime_config_to_dict(config), target)
+
+    assert load_runtime_config(target).voice.enable_tts is False
+
+
+def test_diff_save_writes_only_changed_fields(tmp_path: Path) -> None:
+    config = RuntimeConfig()
+    config.loop_rate_hz = 5.0
+    config.tooling.allow_shell_commands = True
+    target = tmp_path / "runtime_config.json"
+
+    save_runtime_config_diff(config, path=target)
+
+    assert json.loads(target.read_text()) == {
+        "loop_rate_hz": 5.0,
+        "tooling": {"allow_shell_commands": True},
+    }
+    loaded = load_runtime_config(target)
+    assert runtime_config_to_dict(loaded) == runtime_config_to_dict(config)
+
+
+def test_accepts_string_paths(tmp_path: Path) -> None:
+    config = RuntimeConfig()
+    config.memory.history_window = 4
+    target = str(tmp_path / "nested" / "runtime_config.json")
+
+    save_runtime_config(config, target)
+
+    assert load_runtime_config(target).memory.history_window == 4
+    assert load_runtime_config(Path(target)).memory.history_window == 4
+
+
+def test_nested_containers_are_not_shared_between_loads(tmp_path: Path) -> None:
+    config = RuntimeConfig()
+    config.perception = {"cams": {"front": 1}}
+    target = tmp_path / "runtime_config.json"
+    save_runtime_config(config, target)
+
+    first = load_runtime_config(target)
+    first.perception["cams"]["front"] = 99
+    assert load_runtime_config(target).perception["cams"]["front"] == 1
+
+    base = RuntimeConfig()
+    base.planning = {"limits": {"speed": 1.0}}
+    merged = runtime_config_from_dict({}, base)
+    merged.planning["limits"]["speed"] = 2.0
+    assert base.planning["limits"]["speed"] == 1.0
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import gc
+
+from robot_assistant.config.defaults import SafetyConfig
+from robot_assistant.runtime.safety.manager import SafetyManager
+
+
+def test_assigning_privilege_level_updates_the_guard(tmp_path):
+    safety = SafetyManager(SafetyConfig(audit_log_path=str(tmp_path / "safety.log")))
+    safety.set_privilege("command")
+    assert safety.is_allowed("control").allowed
+
+    safety.privilege_level = "informational"
+    status = safety.is_allowed("control")
+    assert not status.allowed
+    assert status.reason == "insufficient_privilege"
+    assert safety.is_allowed("calendar").allowed
+    safety.close()
+
+
+def test_unreferenced_manager_closes_its_audit_log(tmp_path):
+    safety = SafetyManager(SafetyConfig(audit_log_path=str(tmp_path / "safety.log")))
+    handle = safety._log_handle
+    del safety
+    gc.collect()
+    assert handle.closed
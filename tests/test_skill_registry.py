@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from robot_assistant.config.defaults import RuntimeConfig
+from robot_assistant.control.controller import Controller
+from robot_assistant.hardware.interfaces import HardwareSuite
+from robot_assistant.planning.planner import Planner
+from robot_assistant.skills.registry import SkillRegistry
+
+
+def _registry() -> SkillRegistry:
+    config = RuntimeConfig()
+    return SkillRegistry(Planner(config), Controller(HardwareSuite(), config))
+
+
+def test_dispatch_routes_by_skill_name() -> None:
+    registry = _registry()
+    assert registry.dispatch({"skill": "echo"}, {}) == {"intents": {"skill": "echo"}, "state": {}}
+    registry.register("echo", lambda intents, state: {"echo": intents["text"]})
+
+    assert registry.dispatch({"skill": "echo", "text": "hi"}, {}) == {"echo": "hi"}
+    assert registry.dispatch({"skill": "unknown"}, {"pose": 1}) == {
+        "intents": {"skill": "unknown"},
+        "state": {"pose": 1},
+    }
+    assert registry.dispatch({}, {})["intents"] == {}
+
+
+def test_default_override_and_freeze() -> None:
+    registry = _registry()
+    registry.register("default", lambda intents, state: {"handled": "custom"})
+    registry.freeze()
+
+    assert registry.skills is registry.skills
+    with pytest.raises(TypeError):
+        registry.skills["late"] = lambda intents, state: {}  # type: ignore[index]
+    assert registry.dispatch({}, {}) == {"handled": "custom"}
+    assert registry.dispatch({"skill": "unknown"}, {})["intents"] == {"skill": "unknown"}
+    with pytest.raises(RuntimeError):
+        registry.register("late", lambda intents, state: {})
+
+
+def test_register_default_keeps_existing_handler() -> None:
+    registry = _registry()
+    first = lambda intents, state: {"which": "first"}  # noqa: E731
+    second = lambda intents, state: {"which": "second"}  # noqa: E731
+
+    assert registry.register_default("pick", first) is first
+    assert registry.register_default("pick", second) is first
+    assert registry.dispatch({"skill": "pick"}, {}) == {"which": "first"}
+
+
+def test_dispatch_many_preserves_order() -> None:
+    registry = _registry()
+    registry.register("echo", lambda intents, state: {"echo": intents["text"]})
+    batch = [
+        {"skill": "echo", "text": "a"},
+        {"text": "planned"},
+        {"skill": "echo", "text": "b"},
+    ]
+
+    results = registry.dispatch_many(batch, {})
+
+    assert results[0] == {"echo": "a"}
+    assert results[1]["intents"] == {"text": "planned"}
+    assert results[2] == {"echo": "b"}
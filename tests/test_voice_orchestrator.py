@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from robot_assistant.config.defaults import RuntimeConfig
+from robot_assistant.runtime.voice import SpeechRecognizer, VoiceOrchestrator
+
+
+class _CountingRecognizer(SpeechRecognizer):
+    def __init__(self, config) -> None:
+        super().__init__(config)
+        self.cycles = 0
+
+    def maybe_cycle(self) -> None:
+        self.cycles += 1
+
+
+def test_stream_cycle_check_runs_on_every_poll() -> None:
+    config = RuntimeConfig()
+    config.voice.use_wake_word = False
+    recognizer = _CountingRecognizer(config.voice)
+    orchestrator = VoiceOrchestrator(config, recognizer=recognizer)
+    recognizer.enqueue_scripted_input("turn on the lights")
+    recognizer.enqueue_scripted_input("and the fan")
+
+    assert orchestrator.poll_intent()["query"] == "turn on the lights"
+    assert orchestrator.poll_intent()["query"] == "and the fan"
+    assert orchestrator.poll_intent() is None
+    assert orchestrator.drain_intents() == []
+    assert recognizer.cycles == 4
@@ -43,6 +43,9 @@ const splitLines = (value) =>
     .map((entry) => entry.trim())
     .filter(Boolean);
 
+// Audit entries carry integer nanoseconds; older logs used float seconds.
+const auditTimestampMs = (ts) => (ts > 1e12 ? ts / 1e6 : ts * 1000);
+
 export default function App() {
   const queryClient = useQueryClient();
 
@@ -882,7 +885,7 @@ export default function App() {
               <tbody>
                 {safetyLog.map((entry, index) => (
                   <tr key={`${entry.ts ?? index}-${entry.event}`}>
-                    <td>{entry.ts ? new Date(entry.ts * 1000).toLocaleTimeString() : "—"}</td>
+                    <td>{entry.ts ? new Date(auditTimestampMs(entry.ts)).toLocaleTimeString() : "—"}</td>
                     <td>{entry.event}</td>
                     <td>
                       <code>{JSON.stringify(entry.detail ?? entry, null, 0)}</code>